@@ -6,11 +6,52 @@ Render commands:
   manim main.py MeetTheMessage     # Render specific scene
   manim -pqh main.py ColdOpen      # High quality render with preview
   manim -pql main.py               # Low quality for fast testing
+  manim --renderer=opengl main.py  # GPU (OpenGL) renderer instead of Cairo
+  python main.py                   # Render every individual scene in parallel
+  MANIM_FAST=1 manim main.py       # Force 480p15 for the dev loop
+  MANIM_FULL_RENDER=1 manim ...    # One-shot render without partial-movie caching
 """
 
+import argparse
+import gc
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+# =============================================================================
+# RENDER CONFIGURATION
+# =============================================================================
+
+# MANIM_FAST=1 renders at 480p15 for quick iteration, whatever -q flag is given,
+# and skips cosmetic stroke-by-stroke title writing and scaffolding reveals
+# (see write_title and reveal)
+FAST_RENDER = bool(os.environ.get("MANIM_FAST"))
+if FAST_RENDER:
+    config.quality = "low_quality"
+# MANIM_PREVIEW=1 renders at 960x540, 30fps: a quarter of the 1080p60 pixels at
+# half the frame rate, still sharp enough to check layout and small text
+elif os.environ.get("MANIM_PREVIEW"):
+    config.pixel_width, config.pixel_height, config.frame_rate = 960, 540, 30
+
+# FullPresentationWithJPOS has several hundred play() calls; Manim's default of
+# 100 cached partial movies would evict the earlier ones on every re-render
+config.max_files_cached = 1000
+
+# MANIM_FULL_RENDER=1 skips hashing and caching every play() for one-shot
+# renders, where no partial movie would be reused on a later run anyway
+if os.environ.get("MANIM_FULL_RENDER"):
+    config.disable_caching = True
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -31,6 +72,13 @@ COLOR_QMUX = "#8B00FF"              # QMUX (violet/purple)
 COLOR_COMPOSITE = YELLOW            # Composite pattern highlights
 COLOR_XML = "#FF6B35"               # XML snippets (coral orange)
 
+# QMUX architecture layers
+COLOR_APP_LAYER = "#FFEB99"         # Application layer (light yellow)
+COLOR_JPOS_LAYER = "#CCE5FF"        # jPOS infrastructure (light blue)
+COLOR_PROCESSOR = "#E6CCFF"         # Payment processor (light purple)
+
+WATERMARK_TEXT = "F.R - redbee studios"
+
 # =============================================================================
 # CANONICAL MESSAGE DATA - BCD Encoding
 # =============================================================================
@@ -44,6 +92,7 @@ MTI_ASCII = "0200"
 # Primary bitmap (hex, 8 bytes): D0 20 00 00 00 00 00 00
 # Bits set (1-based): 1, 2, 4, 11
 PRIMARY_BITMAP_HEX = "D0 20 00 00 00 00 00 00"
+PRIMARY_BITMAP_BYTES = bytes.fromhex(PRIMARY_BITMAP_HEX)
 
 # Secondary bitmap (hex, 8 bytes): all zeros (present because bit 1 = 1)
 SECONDARY_BITMAP_HEX = "00 00 00 00 00 00 00 00"
@@ -71,11 +120,135 @@ FULL_MESSAGE_HEX = "02 00 D0 20 00 00 00 00 00 00 00 00 00 00 00 00 00 00 16 45
 # Length prefix for sockets (2-byte big-endian): 00 24 (36 bytes)
 LENGTH_PREFIX_HEX = "00 24"
 
+# The canonical message as MessageStrip rows (see MeetTheMessage)
+MESSAGE_ROWS = {
+    "header": [
+        {'hex': MTI_HEX, 'label': 'MTI', 'color': COLOR_MTI},
+        {'hex': PRIMARY_BITMAP_HEX, 'label': 'Primary Bitmap', 'color': COLOR_PRIMARY_BITMAP},
+        {'hex': SECONDARY_BITMAP_HEX, 'label': 'Secondary Bitmap', 'color': COLOR_SECONDARY_BITMAP},
+    ],
+    "pan": [
+        {'hex': DE2_HEX, 'label': 'DE 2 (PAN)', 'color': COLOR_DATA_ELEMENT},
+    ],
+    "amount_stan": [
+        {'hex': DE4_HEX, 'label': 'DE 4 (Amount)', 'color': COLOR_DATA_ELEMENT},
+        {'hex': DE11_HEX, 'label': 'DE 11 (STAN)', 'color': COLOR_DATA_ELEMENT},
+    ],
+}
+
+
+# Fields of the demo ISOPackager shown in the jPOS packager scenes:
+# (id, length, class, short name, full name)
+ISOPACKAGER_FIELDS = [
+    ("0", "4", "IFB_NUMERIC", "MTI", "MESSAGE TYPE INDICATOR"),
+    ("3", "6", "IFB_NUMERIC", "Processing Code", "PROCESSING CODE"),
+    ("11", "6", "IFB_NUMERIC", "STAN", "STAN"),
+    ("41", "8", "IFA_NUMERIC", "Terminal ID", "TERMINAL ID"),
+]
+
+# Deployment descriptors shown in the QMUX configuration sections
+CHANNEL_ADAPTOR_XML = """<channel-adaptor name="my-channel">
+  <channel class="...NACChannel"
+           packager="...GenericPackager">
+    <property name="host" value="localhost" />
+    <property name="port" value="8000" />
+    <property name="timeout" value="300000" />
+  </channel>
+  <in>send</in>
+  <out>receive</out>
+  <reconnect-delay>10000</reconnect-delay>
+</channel-adaptor>"""
+
+QMUX_XML = """<mux class="...QMUX" name="mymux">
+  <key>41,11</key>
+  <in>receive</in>
+  <out>send</out>
+  <ready>...channel-ready</ready>
+  <unhandled>orphans</unhandled>
+  <request-listener .../>
+</mux>"""
+
 
 # =============================================================================
 # HELPER CLASSES
 # =============================================================================
 
+@lru_cache(maxsize=512)
+def _text_proto(text, font_size, font, weight, slant):
+    """Build a Text once per (string, size, font, weight, slant); callers copy it."""
+    return Text(text, font_size=font_size, font=font, weight=weight, slant=slant)
+
+
+def cached_text(text, font_size=DEFAULT_FONT_SIZE, color=WHITE, font="", weight=NORMAL, slant=NORMAL):
+    """Return a fresh copy of a memoized Text, skipping Pango for repeated strings.
+
+    Manim already keeps Pango's SVG output on disk (media/texts), so this only
+    has to avoid re-parsing it within a render.
+    """
+    return _text_proto(text, font_size, font, weight, slant).copy().set_color(color)
+
+
+def _color_key(color):
+    """Return a hashable lru_cache key for a color; ManimColor itself is not hashable."""
+    return ManimColor(color).to_hex()
+
+
+@lru_cache(maxsize=None)
+def _gradient_text_proto(text, font_size, weight, colors):
+    return _text_proto(text, font_size, "", weight, NORMAL).copy().set_color_by_gradient(*colors)
+
+
+def gradient_text(text, *colors, font_size=DEFAULT_FONT_SIZE, weight=NORMAL):
+    """Return a fresh copy of a memoized Text colored with a gradient across its glyphs."""
+    key = tuple(_color_key(color) for color in colors)
+    return _gradient_text_proto(text, font_size, weight, key).copy()
+
+
+@lru_cache(maxsize=64)
+def _text_lines_proto(lines, font_size, font, slant, buff, aligned_edge):
+    # One Text per line: a single Paragraph is split by counting characters,
+    # which goes wrong as soon as Pango fuses a ligature such as "fi"
+    texts = [cached_text(line, font_size=font_size, font=font, slant=slant) for line in lines]
+    return VGroup(*texts).arrange(DOWN, aligned_edge=np.array(aligned_edge), buff=buff)
+
+
+def text_lines(*lines, font_size=DEFAULT_FONT_SIZE, font="", slant=NORMAL, buff=0.3, aligned_edge=LEFT):
+    """Return a fresh copy of a memoized column of lines, one submobject per line.
+
+    Same as VGroup(*texts).arrange(DOWN, aligned_edge=aligned_edge, buff=buff),
+    built once per distinct block. Pass aligned_edge=ORIGIN for centered lines.
+    """
+    return _text_lines_proto(lines, font_size, font, slant, buff, tuple(aligned_edge)).copy()
+
+
+def _warm_text_cache():
+    """Load Pango's font map and pre-write the watermark SVG.
+
+    Manim caches Text SVGs per whole string and style, so the only entry shared
+    by every scene is the watermark; it is built through the same prototype
+    add_watermark uses. The hex string only makes Pango load the default and
+    monospace faces; its own SVG is never reused. render_scenes calls this once
+    before starting its workers, so they do not all write the watermark SVG at
+    the same time; importing main.py does no text work.
+    """
+    Text("0123456789ABCDEF abcdef", font="monospace", font_size=36)
+    _text_proto(WATERMARK_TEXT, 14, "", LIGHT, NORMAL)
+
+
+def split_glyphs(text, parts):
+    """Regroup the glyphs of a Text shaped from the joined parts into one VGroup per part.
+
+    Text drops whitespace glyphs, so each part owns as many glyphs as it has
+    non-space characters. A ligature breaks that count, so a mismatch raises
+    instead of silently shifting glyphs between parts.
+    """
+    expected = sum(not char.isspace() for part in parts for char in part)
+    if len(text.submobjects) != expected:
+        raise ValueError(f"{text.text!r} shaped into {len(text.submobjects)} glyphs, expected {expected}")
+    glyphs = iter(text)
+    return [VGroup(*[next(glyphs) for char in part if not char.isspace()]) for part in parts]
+
+
 class ByteBlock(VGroup):
     """Displays a block of hex bytes with optional label."""
 
@@ -83,12 +256,11 @@ class ByteBlock(VGroup):
         super().__init__(**kwargs)
 
         # Create hex text
-        self.hex_text = Text(hex_string, font_size=24, font="monospace")
-        self.hex_text.set_color(color)
+        self.hex_text = cached_text(hex_string, font_size=24, color=color, font="monospace")
 
         # Create label if provided
         if label_text:
-            self.label = Text(label_text, font_size=20)
+            self.label = cached_text(label_text, font_size=20)
             self.label.next_to(self.hex_text, label_position, buff=0.2)
             self.add(self.hex_text, self.label)
         else:
@@ -104,67 +276,87 @@ class MessageStrip(VGroup):
         """
         super().__init__(**kwargs)
 
+        # Shape all labels (increased from 18 to 28) and all hex strings
+        # (increased from 20 to 30) as one Text per row, then split per segment
+        label_parts = [segment['label'] for segment in segments]
+        hex_parts = [segment['hex'] for segment in segments]
+        labels = split_glyphs(cached_text("  ".join(label_parts), font_size=28, weight=BOLD), label_parts)
+        hex_texts = split_glyphs(cached_text("  ".join(hex_parts), font_size=30, font="monospace"), hex_parts)
+
         self.blocks = []
-        for segment in segments:
-            # Create label above (increased from 18 to 28)
-            label = Text(segment['label'], font_size=28, weight=BOLD)
+        for segment, label, hex_text in zip(segments, labels, hex_texts):
             label.set_color(segment['color'])
-
-            # Create hex text below (increased from 20 to 30)
-            hex_text = Text(segment['hex'], font_size=30, font="monospace")
             hex_text.set_color(segment['color'])
 
             # Stack them vertically
-            block = VGroup(label, hex_text).arrange(DOWN, buff=0.2)
+            hex_text.next_to(label, DOWN, buff=0.2)
+            block = VGroup(label, hex_text)
             self.blocks.append(block)
 
-        # Arrange all blocks horizontally
+        # Lay blocks out left to right from their widths, centers on one line
+        x = 0
+        for block in self.blocks:
+            block.move_to(RIGHT * (x + block.width / 2))
+            x += block.width + 0.3
         self.add(*self.blocks)
-        self.arrange(RIGHT, buff=0.3)
+        self.center()
+
+
+@lru_cache(maxsize=None)
+def _message_strip_proto(row):
+    return MessageStrip(MESSAGE_ROWS[row])
+
+
+def message_strip(row):
+    """Return a fresh copy of the canonical MessageStrip for one of MESSAGE_ROWS."""
+    return _message_strip_proto(row).copy()
+
+
+@lru_cache(maxsize=None)
+def _stacked_message_strips_proto():
+    rows = [message_strip(row).scale(0.75) for row in MESSAGE_ROWS]
+    return VGroup(*rows).arrange(DOWN, buff=0.5)
+
+
+def stacked_message_strips():
+    """Return a fresh copy of every MESSAGE_ROWS strip, scaled to 0.75 and stacked top to bottom."""
+    return _stacked_message_strips_proto().copy()
 
 
 class BitmapVisualizer(VGroup):
     """Displays binary representation of hex bytes with bit numbers."""
 
     def __init__(self, hex_value, num_bytes=1, **kwargs):
-        super().__init__(**kwargs)
+        """Show the first num_bytes of hex_value, a hex string or raw bytes such as PRIMARY_BITMAP_BYTES.
 
-        # Convert hex to binary (8 or 16 bits)
-        if num_bytes == 2:
-            # Handle two bytes (e.g., "D0 20")
-            hex_parts = hex_value.split()
-            byte1 = int(hex_parts[0], 16)
-            byte2 = int(hex_parts[1], 16)
-            binary_string = format(byte1, '08b') + format(byte2, '08b')
-            num_bits = 16
-        else:
-            # Handle single byte
-            byte_value = int(hex_value, 16)
-            binary_string = format(byte_value, '08b')
-            num_bits = 8
-
-        # Create bit numbers on top (aligned with digits)
-        bit_numbers = VGroup()
-        for i in range(1, num_bits + 1):
-            num = Text(str(i), font_size=28, color=GRAY, weight=BOLD)
-            bit_numbers.add(num)
-
-        # Create binary digits
-        binary_digits = VGroup()
-        for bit in binary_string:
-            digit = Text(bit, font_size=36, font="monospace", weight=BOLD)
-            if bit == '1':
-                digit.set_color(YELLOW)
-            else:
-                digit.set_color(GRAY)
-            binary_digits.add(digit)
+        num_bytes=None shows every byte of hex_value, e.g. a full 64-bit bitmap.
+        """
+        super().__init__(**kwargs)
 
-        # Arrange with same spacing
+        # Convert hex to one 0/1 entry per bit
+        hex_bytes = bytes.fromhex(hex_value) if isinstance(hex_value, str) else hex_value
+        bits = np.unpackbits(np.frombuffer(hex_bytes[:num_bytes], dtype=np.uint8))
+        binary_string = "".join(map(str, bits))
+        num_bits = len(bits)
+        set_bit_indices = np.flatnonzero(bits).tolist()
+
+        # Create bit numbers on top (aligned with digits): one Text for the
+        # whole row, regrouped so each number's glyphs move together
+        labels = [str(i) for i in range(1, num_bits + 1)]
+        bit_numbers = VGroup(*split_glyphs(cached_text(" ".join(labels), font_size=28, color=GRAY, weight=BOLD), labels))
+
+        # Create binary digits as a single Text; glyph i is bit i. The whole
+        # row starts GRAY, so only the set bits (from the mask) are recolored.
+        binary_digits = cached_text(binary_string, font_size=36, color=GRAY, font="monospace", weight=BOLD)
+        for i in set_bit_indices:
+            binary_digits[i].set_color(YELLOW)
+
+        # Arrange with same spacing: each glyph keeps its own width, 0.35 apart
         bit_numbers.arrange(RIGHT, buff=0.35)
         binary_digits.arrange(RIGHT, buff=0.35)
 
         # Align bit numbers to binary digits
-        for i, (num, digit) in enumerate(zip(bit_numbers, binary_digits)):
+        for num, digit in zip(bit_numbers, binary_digits):
             num.align_to(digit, LEFT)
 
         # Stack them
@@ -174,6 +366,104 @@ class BitmapVisualizer(VGroup):
         self.bit_numbers = bit_numbers
         self.binary_digits = binary_digits
         self.binary_string = binary_string
+        self.bits = bits
+        self.set_bit_indices = set_bit_indices
+
+
+@lru_cache(maxsize=16)
+def _bitmap_visualizer_proto(hex_value, num_bytes):
+    return BitmapVisualizer(hex_value, num_bytes)
+
+
+def bitmap_visualizer(hex_value, num_bytes=1):
+    """Return a fresh copy of a cached BitmapVisualizer for hex_value (hex string or bytes)."""
+    return _bitmap_visualizer_proto(hex_value, num_bytes).copy()
+
+
+@lru_cache(maxsize=None)
+def _isopackager_xml_proto(font_size, one_line, buff):
+    lines = ['<isopackager>']
+    for field_id, length, class_name, label, name in ISOPACKAGER_FIELDS:
+        if one_line:
+            lines.append(f'  <isofield id="{field_id}" length="{length}" name="{name}" class="org.jpos.iso.{class_name}" />')
+        else:
+            lines.append(f'  <isofield id="{field_id}" class="{class_name}"')
+            lines.append(f'            length="{length}" name="{label}"/>')
+    lines.append('</isopackager>')
+    return text_lines(*lines, font_size=font_size, font="monospace", buff=buff).set_color(COLOR_XML)
+
+
+def isopackager_xml(font_size, one_line=False, buff=0.05):
+    """Return a fresh copy of the ISOPACKAGER_FIELDS packager XML, one submobject per line.
+
+    one_line=True writes each <isofield> on a single line with its full class
+    name; otherwise every field spans two lines (id/class, then length/name).
+    """
+    return _isopackager_xml_proto(font_size, one_line, buff).copy()
+
+
+@lru_cache(maxsize=None)
+def _thread_indicator_proto(name, state):
+    colors = {"active": GREEN, "waiting": YELLOW, "done": GRAY}
+    circle = Circle(radius=0.25, color=colors.get(state, GREEN), fill_opacity=0.6, stroke_width=2)
+    # Both are built centered on the origin
+    label = cached_text(name, font_size=16, weight=BOLD)
+    return VGroup(circle, label)
+
+
+def thread_indicator(name, state="active"):
+    """Return a fresh copy of a cached thread marker: a circle colored by state, labelled name."""
+    return _thread_indicator_proto(name, state).copy()
+
+
+@lru_cache(maxsize=None)
+def _thread_column_proto(state):
+    threads = VGroup(*[thread_indicator(f"T{i+1}", state) for i in range(3)])
+    return threads.arrange(DOWN, buff=0.7).scale(0.9)
+
+
+def thread_column(state="active"):
+    """Return a fresh copy of the cached T1-T3 column used by the QMUX flow diagrams."""
+    return _thread_column_proto(state).copy()
+
+
+@lru_cache(maxsize=None)
+def _xml_code_proto(code, line_colors):
+    code_block = Code(
+        code_string=code,
+        language="xml",
+        formatter_style="native",
+        add_line_numbers=False,
+        background="rectangle",
+        paragraph_config={
+            "font": "monospace",
+            "font_size": 24,
+            "line_spacing": 1
+        }
+    )
+    # Only the highlighted Paragraph is shown, not the background
+    lines = code_block[1]
+    for index, color in line_colors:
+        lines[index].set_color(color)
+    return lines
+
+
+def xml_code(code, line_colors=None):
+    """Return a fresh copy of the syntax-highlighted lines of an XML snippet, one submobject per line.
+
+    line_colors maps line indices to a flat color that replaces the highlighting.
+    """
+    key = tuple((index, _color_key(color)) for index, color in (line_colors or {}).items())
+    return _xml_code_proto(code, key).copy()
+
+
+def align_labels_to_lines(labels, lines, left_x):
+    """Move each label so its left edge sits at left_x, level with the matching line."""
+    # get_left() is the midpoint of the left edge, so its y is the label's center
+    offsets = np.array([[left_x, line.get_y()] for line in lines]) - np.array([label.get_left()[:2] for label in labels])
+    for label, (dx, dy) in zip(labels, offsets):
+        label.shift([dx, dy, 0])
+    return labels
 
 
 # =============================================================================
@@ -181,14 +471,112 @@ class BitmapVisualizer(VGroup):
 # =============================================================================
 
 def add_watermark(scene):
-    """Add 'F.R - redbee studios' watermark to bottom-right corner of scene."""
-    watermark = Text("F.R - redbee studios", font_size=14, color=GRAY, weight=LIGHT)
+    """Add 'F.R - redbee studios' watermark to bottom-right corner of scene.
+
+    In a chained presentation the previous part may have left its watermark on
+    screen; that one is reused instead of stacking a second, darker copy.
+    """
+    watermark = getattr(scene, "watermark", None)
+    if watermark is not None and watermark in scene.mobjects:
+        return watermark
+    watermark = cached_text(WATERMARK_TEXT, font_size=14, color=GRAY, weight=LIGHT)
     watermark.set_opacity(0.5)
     watermark.to_corner(DR, buff=0.3)
     scene.add(watermark)
+    scene.watermark = watermark
     return watermark
 
 
+def write_title(scene, text, font_size=40, color=WHITE):
+    """Write a bold title at the top edge, built from the shared cached_text template.
+
+    With MANIM_FAST the title fades in quickly instead of being drawn stroke by stroke.
+    """
+    title = cached_text(text, font_size=font_size, color=color, weight=BOLD)
+    title.to_edge(UP)
+    if FAST_RENDER:
+        scene.play(FadeIn(title), run_time=0.3)
+    else:
+        scene.play(Write(title), run_time=0.8)
+    return title
+
+
+def reveal(scene, *animations):
+    """Play decorative reveal animations; with MANIM_FAST, cut straight to their end state.
+
+    Meant for scaffolding (boxes, lines, labels) whose final layout is all that matters.
+    """
+    if FAST_RENDER:
+        scene.add(*[animation.mobject for animation in animations])
+        scene.wait(0.1)
+    else:
+        scene.play(*animations)
+
+
+def fade_out_all(scene, **kwargs):
+    """Fade out everything on screen as a single animation."""
+    scene.play(FadeOut(Group(*scene.mobjects)), **kwargs)
+
+
+class Translate(Animation):
+    """Slide a mobject by a fixed offset.
+
+    Each frame shifts the points by the change in progress, instead of
+    interpolating every point between a start copy and a target copy the way
+    mobject.animate.move_to() does.
+    """
+
+    def __init__(self, mobject, offset, **kwargs):
+        super().__init__(mobject, **kwargs)
+        self.offset = np.array(offset)
+
+    def begin(self):
+        self.progress = 0
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        progress = self.rate_func(alpha)
+        self.mobject.shift((progress - self.progress) * self.offset)
+        self.progress = progress
+
+
+class LaggedFadeIn(FadeIn):
+    """FadeIn of a whole group whose top-level children start one after another.
+
+    Times each child exactly like LaggedStart(*[FadeIn(child) ...]) does, but
+    as a single animation that interpolates every child's points in one pass.
+    """
+
+    def __init__(self, group, shift=ORIGIN, lag_ratio=0.3, **kwargs):
+        kwargs.setdefault("run_time", 1 + (len(group) - 1) * lag_ratio)
+        super().__init__(group, shift=shift, lag_ratio=lag_ratio, **kwargs)
+
+    def begin(self):
+        # Map every family member to the top-level child it belongs to
+        self.child_index = {
+            id(member): index
+            for index, child in enumerate(self.mobject.submobjects)
+            for member in child.get_family()
+        }
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        num_children = len(self.mobject.submobjects)
+        for mobs in self.get_all_families_zipped():
+            index = self.child_index.get(id(mobs[0]), 0)
+            self.interpolate_submobject(*mobs, self.get_sub_alpha(alpha, index, num_children))
+
+
+def lagged_fade_in(group, shift=ORIGIN, lag_ratio=0.3, **kwargs):
+    """Fade in each submobject of group in turn, optionally shifting in from a direction.
+
+    group may also be a plain list of mobjects.
+    """
+    if not isinstance(group, Mobject):
+        group = Group(*group)
+    return LaggedFadeIn(group, shift=shift, lag_ratio=lag_ratio, **kwargs)
+
+
 class ISO8583Scenes:
     """
     Helper class containing all scene construction logic.
@@ -202,18 +590,17 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("ISO 8583 in 10 Minutes", font_size=60, weight=BOLD)
-        title.set_color_by_gradient(COLOR_MTI, COLOR_DATA_ELEMENT)
+        title = gradient_text("ISO 8583 in 10 Minutes", COLOR_MTI, COLOR_DATA_ELEMENT, font_size=60, weight=BOLD)
 
         # Subtitle
-        subtitle = Text("Messages behind card payments", font_size=30)
+        subtitle = cached_text("Messages behind card payments", font_size=30)
         subtitle.next_to(title, DOWN, buff=0.5)
 
         # Animate
         scene.play(FadeIn(title, shift=DOWN), run_time=1)
         scene.play(FadeIn(subtitle), run_time=0.5)
         scene.wait(1)
-        scene.play(FadeOut(title), FadeOut(subtitle))
+        scene.play(FadeOut(Group(title, subtitle)))
 
     @staticmethod
     def construct_what_is_iso8583(scene):
@@ -221,10 +608,10 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("ISO 8583", font_size=50, weight=BOLD, color=COLOR_MTI)
+        title = cached_text("ISO 8583", font_size=50, weight=BOLD, color=COLOR_MTI)
 
         # Timeline
-        timeline = Text("1987 → today", font_size=30)
+        timeline = cached_text("1987 → today", font_size=30)
         timeline.next_to(title, DOWN, buff=0.4)
 
         scene.play(Write(title), run_time=0.8)
@@ -238,17 +625,18 @@ class ISO8583Scenes:
         )
 
         # Bullet points
-        bullets = VGroup(
-            Text("• Defines how payment systems communicate", font_size=24),
-            Text("• Authorization, financial transactions, reversals", font_size=24),
-            Text("• Network management messages", font_size=24),
-            Text("• Compact, efficient message layout", font_size=24),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
+        bullets = text_lines(
+            "• Defines how payment systems communicate",
+            "• Authorization, financial transactions, reversals",
+            "• Network management messages",
+            "• Compact, efficient message layout",
+            font_size=24,
+        )
         bullets.next_to(title, DOWN, buff=0.8)
 
-        scene.play(LaggedStart(*[FadeIn(bullet, shift=RIGHT) for bullet in bullets], lag_ratio=0.3))
+        scene.play(lagged_fade_in(bullets, shift=RIGHT, lag_ratio=0.3))
         scene.wait(2)
-        scene.play(FadeOut(title), FadeOut(bullets))
+        scene.play(FadeOut(Group(title, bullets)))
 
     @staticmethod
     def construct_meet_the_message(scene):
@@ -256,70 +644,52 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Meet the Message", font_size=40, weight=BOLD)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "Meet the Message")
 
-        # Create message segments - Row 1
-        row1_segments = [
-            {'hex': MTI_HEX, 'label': 'MTI', 'color': COLOR_MTI},
-            {'hex': PRIMARY_BITMAP_HEX, 'label': 'Primary Bitmap', 'color': COLOR_PRIMARY_BITMAP},
-            {'hex': SECONDARY_BITMAP_HEX, 'label': 'Secondary Bitmap', 'color': COLOR_SECONDARY_BITMAP},
-        ]
-
-        # Create message segments - Row 2
-        row2_segments = [
-            {'hex': DE2_HEX, 'label': 'DE 2 (PAN)', 'color': COLOR_DATA_ELEMENT},
-        ]
-
-        # Create message segments - Row 3
-        row3_segments = [
-            {'hex': DE4_HEX, 'label': 'DE 4 (Amount)', 'color': COLOR_DATA_ELEMENT},
-            {'hex': DE11_HEX, 'label': 'DE 11 (STAN)', 'color': COLOR_DATA_ELEMENT},
-        ]
-
-        # Create rows
-        row1 = MessageStrip(row1_segments)
-        row1.scale(0.75)
-
-        row2 = MessageStrip(row2_segments)
-        row2.scale(0.75)
-
-        row3 = MessageStrip(row3_segments)
-        row3.scale(0.75)
-
-        # Arrange rows vertically
-        message_display = VGroup(row1, row2, row3).arrange(DOWN, buff=0.5)
+        # Rows: MTI + bitmaps, DE 2, DE 4 + DE 11 (laid out once per process)
+        message_display = stacked_message_strips()
         message_display.next_to(title, DOWN, buff=0.8)
+        row1, row2, row3 = message_display
 
         # Animate all segments appearing
         all_blocks = row1.blocks + row2.blocks + row3.blocks
-        scene.play(LaggedStart(*[FadeIn(block, shift=UP) for block in all_blocks], lag_ratio=0.15))
+        scene.play(lagged_fade_in(all_blocks, shift=UP, lag_ratio=0.15))
         scene.wait(1)
 
         # Add BCD encoding note
-        bcd_note = Text("BCD encoding: 2 digits per byte", font_size=24, color=YELLOW, slant=ITALIC)
+        bcd_note = cached_text("BCD encoding: 2 digits per byte", font_size=24, color=YELLOW, slant=ITALIC)
         bcd_note.to_edge(DOWN, buff=0.5)
         scene.play(FadeIn(bcd_note))
         scene.wait(1.5)
         scene.play(FadeOut(bcd_note))
 
-        # Highlight each segment with 3-second intervals
-        highlights = []
-        for block in all_blocks:
-            highlight = SurroundingRectangle(block, color=YELLOW, buff=0.15, stroke_width=3)
-            highlights.append(highlight)
+        # Highlight each segment with 3-second intervals, reshaping a single
+        # rectangle onto each block. Block geometry is measured once up front:
+        # the blocks do not move after layout.
+        highlight_buff = 0.15
+        targets = [
+            (block.width + 2 * highlight_buff, block.height + 2 * highlight_buff, block.get_center())
+            for block in all_blocks
+        ]
+        first_width, first_height, first_center = targets[0]
+        highlight = Rectangle(width=first_width, height=first_height, color=YELLOW, stroke_width=3)
+        highlight.move_to(first_center)
+        scene.play(Create(highlight), run_time=0.5)
+        scene.wait(3)
 
-        for i, highlight in enumerate(highlights):
-            if i == 0:
-                scene.play(Create(highlight), run_time=0.5)
-            else:
-                scene.play(ReplacementTransform(highlights[i-1], highlight), run_time=0.5)
+        for width, height, center in targets[1:]:
+            scene.play(
+                highlight.animate
+                .stretch_to_fit_width(width)
+                .stretch_to_fit_height(height)
+                .move_to(center),
+                run_time=0.5,
+            )
             scene.wait(3)
 
-        scene.play(FadeOut(highlights[-1]))
+        scene.play(FadeOut(highlight))
         scene.wait(1)
-        scene.play(FadeOut(title), FadeOut(message_display))
+        scene.play(FadeOut(Group(title, message_display)))
 
     @staticmethod
     def construct_mti_deep_dive(scene):
@@ -327,17 +697,15 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Message Type Indicator (MTI)", font_size=40, weight=BOLD)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "Message Type Indicator (MTI)")
 
         # MTI bytes (BCD) with ASCII overlay
-        mti_hex = Text(MTI_HEX, font_size=40, font="monospace", color=COLOR_MTI)
-        mti_ascii = Text(MTI_ASCII, font_size=50, font="monospace", color=COLOR_MTI, weight=BOLD)
+        mti_hex = cached_text(MTI_HEX, font_size=40, font="monospace", color=COLOR_MTI)
+        mti_ascii = cached_text(MTI_ASCII, font_size=50, font="monospace", color=COLOR_MTI, weight=BOLD)
 
         # BCD explanation
-        bcd_label = Text("BCD packed: 02 00", font_size=24, color=YELLOW)
-        ascii_label = Text("Represents: 0200", font_size=24, color=YELLOW)
+        bcd_label = cached_text("BCD packed: 02 00", font_size=24, color=YELLOW)
+        ascii_label = cached_text("Represents: 0200", font_size=24, color=YELLOW)
 
         mti_hex.move_to(UP * 1.5)
         mti_ascii.move_to(UP * 1.5)
@@ -346,38 +714,44 @@ class ISO8583Scenes:
 
         scene.play(FadeIn(mti_hex), FadeIn(bcd_label))
         scene.wait(0.8)
-        scene.play(
-            Transform(mti_hex, mti_ascii),
-            Transform(bcd_label, ascii_label),
-            run_time=1
-        )
+        # One Transform over both pairs: Manim aligns the groups child by child
+        scene.play(Transform(VGroup(mti_hex, bcd_label), VGroup(mti_ascii, ascii_label)), run_time=1)
         scene.wait(0.8)
-        scene.play(FadeOut(bcd_label))  # bcd_label now contains ascii_label after transform
 
         # MTI breakdown
-        breakdown = VGroup(
-            Text("0 — ISO version (legacy)", font_size=28),
-            Text("2 — Class = Financial", font_size=28),
-            Text("0 — Function = Request", font_size=28),
-            Text("0 — Origin = Acquirer", font_size=28),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        breakdown = text_lines(
+            "0 — ISO version (legacy)",
+            "2 — Class = Financial",
+            "0 — Function = Request",
+            "0 — Origin = Acquirer",
+            font_size=28,
+            buff=0.25,
+        )
         breakdown.next_to(mti_hex, DOWN, buff=0.8)
 
-        scene.play(LaggedStart(*[FadeIn(line, shift=RIGHT) for line in breakdown], lag_ratio=0.3))
+        # bcd_label now contains ascii_label after transform; fade it while the breakdown comes in
+        scene.play(AnimationGroup(
+            FadeOut(bcd_label),
+            lagged_fade_in(breakdown, shift=RIGHT, lag_ratio=0.3),
+            lag_ratio=0.1,
+        ))
         scene.wait(1)
-        scene.play(FadeOut(breakdown))
 
         # Common MTI pairs
-        pairs = VGroup(
-            Text("0100/0110 — Authorization request/response", font_size=30),
-            Text("0200/0210 — Financial request/response", font_size=30, color=COLOR_MTI),
-            Text("0800/0810 — Network management", font_size=30),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
+        pairs = text_lines(
+            "0100/0110 — Authorization request/response",
+            "0200/0210 — Financial request/response",
+            "0800/0810 — Network management",
+            font_size=30,
+        )
+        pairs[1].set_color(COLOR_MTI)
         pairs.next_to(mti_hex, DOWN, buff=0.8)
 
-        scene.play(LaggedStart(*[FadeIn(pair, shift=RIGHT) for pair in pairs], lag_ratio=0.3))
+        # pairs sits where breakdown was, so clear it first
+        scene.play(FadeOut(breakdown))
+        scene.play(lagged_fade_in(pairs, shift=RIGHT, lag_ratio=0.3))
         scene.wait(2)
-        scene.play(FadeOut(title), FadeOut(mti_hex), FadeOut(pairs))
+        scene.play(FadeOut(Group(title, mti_hex, pairs)))
 
     @staticmethod
     def construct_bitmap_concept(scene):
@@ -385,24 +759,22 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Bitmap Concept", font_size=40, weight=BOLD, color=COLOR_PRIMARY_BITMAP)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "Bitmap Concept", color=COLOR_PRIMARY_BITMAP)
 
         # Show first two bytes of primary bitmap
-        bitmap_hex = Text(PRIMARY_BITMAP_HEX, font_size=36, font="monospace", color=COLOR_PRIMARY_BITMAP)
+        bitmap_hex = cached_text(PRIMARY_BITMAP_HEX, font_size=36, font="monospace", color=COLOR_PRIMARY_BITMAP)
         bitmap_hex.move_to(UP * 2)
         scene.play(FadeIn(bitmap_hex))
         scene.wait(0.5)
 
         # Highlight first two bytes
-        first_two_bytes = Text("D0 20", font_size=36, font="monospace", color=COLOR_PRIMARY_BITMAP)
+        first_two_bytes = cached_text("D0 20", font_size=36, font="monospace", color=COLOR_PRIMARY_BITMAP)
         first_two_bytes.move_to(UP * 2)
         scene.play(Transform(bitmap_hex, first_two_bytes))
         scene.wait(0.5)
 
         # Create binary visualization for 2 bytes (16 bits)
-        binary_viz = BitmapVisualizer("D0 20", num_bytes=2)
+        binary_viz = bitmap_visualizer(PRIMARY_BITMAP_BYTES, num_bytes=2)
         binary_viz.scale(0.7)
         binary_viz.move_to(ORIGIN + UP * 0.3)
 
@@ -410,24 +782,27 @@ class ISO8583Scenes:
         scene.wait(0.5)
 
         # Pulse the set bits: D0 = 11010000 (bits 1,2,4), 20 = 00100000 (bit 11)
-        # Bit indices: 0,1,3 for first byte, 10 for second byte
-        set_bits = [0, 1, 3, 10]
-        pulses = [binary_viz.binary_digits[i].animate.scale(1.3).set_color(YELLOW) for i in set_bits]
-        scene.play(*pulses, run_time=0.5)
-        scene.play(*[binary_viz.binary_digits[i].animate.scale(1/1.3) for i in set_bits], run_time=0.5)
+        set_bits = binary_viz.set_bit_indices
+        # Indicate's there_and_back is the same smooth 0.5s up / 0.5s down, in one play
+        scene.play(
+            *[Indicate(binary_viz.binary_digits[i], scale_factor=1.3, color=YELLOW) for i in set_bits],
+            run_time=1,
+        )
 
         # Show implications
-        implications = VGroup(
-            Text("Bit 1 = 1  →  Secondary bitmap present", font_size=26),
-            Text("Bit 2 = 1  →  DE 2 present", font_size=26),
-            Text("Bit 4 = 1  →  DE 4 present", font_size=26),
-            Text("Bit 11 = 1  →  DE 11 present", font_size=26),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        implications = text_lines(
+            "Bit 1 = 1  →  Secondary bitmap present",
+            "Bit 2 = 1  →  DE 2 present",
+            "Bit 4 = 1  →  DE 4 present",
+            "Bit 11 = 1  →  DE 11 present",
+            font_size=26,
+            buff=0.25,
+        )
         implications.next_to(binary_viz, DOWN, buff=0.8)
 
-        scene.play(LaggedStart(*[FadeIn(imp, shift=RIGHT) for imp in implications], lag_ratio=0.3))
+        scene.play(lagged_fade_in(implications, shift=RIGHT, lag_ratio=0.3))
         scene.wait(2)
-        scene.play(FadeOut(title), FadeOut(bitmap_hex), FadeOut(binary_viz), FadeOut(implications))
+        scene.play(FadeOut(Group(title, bitmap_hex, binary_viz, implications)))
 
     @staticmethod
     def construct_secondary_bitmap(scene):
@@ -435,27 +810,27 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Secondary Bitmap", font_size=40, weight=BOLD, color=COLOR_SECONDARY_BITMAP)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "Secondary Bitmap", color=COLOR_SECONDARY_BITMAP)
 
         # Secondary bitmap
-        sec_bitmap = Text(SECONDARY_BITMAP_HEX, font_size=36, font="monospace", color=COLOR_SECONDARY_BITMAP)
+        sec_bitmap = cached_text(SECONDARY_BITMAP_HEX, font_size=36, font="monospace", color=COLOR_SECONDARY_BITMAP)
         sec_bitmap.move_to(ORIGIN + UP * 0.5)
         scene.play(FadeIn(sec_bitmap))
         scene.wait(0.5)
 
         # Explanation
-        explanation = VGroup(
-            Text("Present because bit 1 is set in primary bitmap", font_size=24),
-            Text("Extends field range to DE 65-128", font_size=24),
-            Text("All zeros = no extended fields in this message", font_size=24),
-        ).arrange(DOWN, buff=0.3)
+        explanation = text_lines(
+            "Present because bit 1 is set in primary bitmap",
+            "Extends field range to DE 65-128",
+            "All zeros = no extended fields in this message",
+            font_size=24,
+            aligned_edge=ORIGIN,
+        )
         explanation.next_to(sec_bitmap, DOWN, buff=0.8)
 
-        scene.play(LaggedStart(*[FadeIn(exp, shift=UP) for exp in explanation], lag_ratio=0.3))
+        scene.play(lagged_fade_in(explanation, shift=UP, lag_ratio=0.3))
         scene.wait(2)
-        scene.play(FadeOut(title), FadeOut(sec_bitmap), FadeOut(explanation))
+        scene.play(FadeOut(Group(title, sec_bitmap, explanation)))
 
     @staticmethod
     def construct_data_elements_fixed_vs_variable(scene):
@@ -463,15 +838,13 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Data Elements: Fixed vs Variable", font_size=38, weight=BOLD)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "Data Elements: Fixed vs Variable", font_size=38)
 
         # === DE 2 (LLVAR) - Upper section ===
-        de2_label = Text("DE 2 — PAN (LLVAR, BCD)", font_size=32, color=COLOR_DATA_ELEMENT, weight=BOLD)
+        de2_label = cached_text("DE 2 — PAN (LLVAR, BCD)", font_size=32, color=COLOR_DATA_ELEMENT, weight=BOLD)
         de2_label.move_to(UP * 2.2)
 
-        de2_hex = Text(DE2_HEX, font_size=24, font="monospace", color=COLOR_DATA_ELEMENT)
+        de2_hex = cached_text(DE2_HEX, font_size=24, font="monospace", color=COLOR_DATA_ELEMENT)
         de2_hex.next_to(de2_label, DOWN, buff=0.5)
 
         scene.play(Write(de2_label))
@@ -479,19 +852,19 @@ class ISO8583Scenes:
         scene.wait(0.5)
 
         # Highlight length prefix (now 1 byte BCD)
-        length_part = Text(DE2_LENGTH_HEX, font_size=24, font="monospace", color=YELLOW)
+        length_part = cached_text(DE2_LENGTH_HEX, font_size=24, font="monospace", color=YELLOW)
         length_part.next_to(de2_label, DOWN, buff=0.5)
         length_part.align_to(de2_hex, LEFT)
 
         length_brace = Brace(length_part, DOWN, color=YELLOW)
-        length_text = Text("length = 16 (1 byte)", font_size=24, color=YELLOW)
+        length_text = cached_text("length = 16 (1 byte)", font_size=24, color=YELLOW)
         length_text.next_to(length_brace, DOWN, buff=0.3)
 
         scene.play(Create(length_brace), Write(length_text))
         scene.wait(0.8)
 
         # Show value explanation - centered
-        value_text = Text(f"Value: {DE2_VALUE} (BCD packed, 8 bytes)", font_size=24, color=COLOR_DATA_ELEMENT)
+        value_text = cached_text(f"Value: {DE2_VALUE} (BCD packed, 8 bytes)", font_size=24, color=COLOR_DATA_ELEMENT)
         value_text.next_to(length_text, DOWN, buff=0.4)
         value_text.set_x(0)
         scene.play(FadeIn(value_text))
@@ -505,10 +878,10 @@ class ISO8583Scenes:
         scene.wait(0.3)
 
         # === DE 4 (Fixed 12) - Lower section ===
-        de4_label = Text("DE 4 — Amount (N 12, BCD)", font_size=32, color=COLOR_DATA_ELEMENT, weight=BOLD)
+        de4_label = cached_text("DE 4 — Amount (N 12, BCD)", font_size=32, color=COLOR_DATA_ELEMENT, weight=BOLD)
         de4_label.move_to(DOWN * 1.2)
 
-        de4_hex = Text(DE4_HEX, font_size=24, font="monospace", color=COLOR_DATA_ELEMENT)
+        de4_hex = cached_text(DE4_HEX, font_size=24, font="monospace", color=COLOR_DATA_ELEMENT)
         de4_hex.next_to(de4_label, DOWN, buff=0.5)
 
         scene.play(Write(de4_label))
@@ -517,14 +890,14 @@ class ISO8583Scenes:
 
         # Brace for entire field - now below
         de4_brace = Brace(de4_hex, DOWN, color=YELLOW)
-        de4_brace_text = Text("12 digits (6 bytes BCD)", font_size=24, color=YELLOW)
+        de4_brace_text = cached_text("12 digits (6 bytes BCD)", font_size=24, color=YELLOW)
         de4_brace_text.next_to(de4_brace, DOWN, buff=0.15)
 
         scene.play(Create(de4_brace), Write(de4_brace_text))
         scene.wait(0.5)
 
         # Show interpretation - to the right side
-        amount_text = Text(f"= {DE4_VALUE} = $10.00", font_size=26, color=COLOR_DATA_ELEMENT)
+        amount_text = cached_text(f"= {DE4_VALUE} = $10.00", font_size=26, color=COLOR_DATA_ELEMENT)
         amount_text.next_to(de4_hex, RIGHT, buff=0.8)
         scene.play(FadeIn(amount_text))
 
@@ -532,10 +905,8 @@ class ISO8583Scenes:
         scene.play(Indicate(amount_text, color=YELLOW, scale_factor=1.1))
         scene.wait(1.5)
 
-        # Fade out annotations
-        scene.play(FadeOut(de4_brace), FadeOut(de4_brace_text))
-
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        # Fade out annotations together with everything else
+        fade_out_all(scene)
 
     @staticmethod
     def construct_another_fixed_example(scene):
@@ -543,48 +914,42 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("DE 11 — STAN (System Trace Audit Number)", font_size=38, weight=BOLD, color=COLOR_DATA_ELEMENT)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "DE 11 — STAN (System Trace Audit Number)", font_size=38, color=COLOR_DATA_ELEMENT)
 
         # DE 11 hex (BCD)
-        de11_hex = Text(DE11_HEX, font_size=40, font="monospace", color=COLOR_DATA_ELEMENT)
+        de11_hex = cached_text(DE11_HEX, font_size=40, font="monospace", color=COLOR_DATA_ELEMENT)
         de11_hex.move_to(UP * 1)
 
-        bcd_note = Text("BCD: 12 34 56", font_size=28, color=YELLOW)
+        bcd_note = cached_text("BCD: 12 34 56", font_size=28, color=YELLOW)
         bcd_note.next_to(de11_hex, DOWN, buff=0.4)
 
         scene.play(FadeIn(de11_hex), FadeIn(bcd_note))
         scene.wait(0.5)
 
         # Show decoded value
-        de11_ascii = Text(DE11_VALUE, font_size=48, font="monospace", color=COLOR_DATA_ELEMENT, weight=BOLD)
+        de11_ascii = cached_text(DE11_VALUE, font_size=48, font="monospace", color=COLOR_DATA_ELEMENT, weight=BOLD)
         de11_ascii.move_to(UP * 1)
 
-        decoded_note = Text("Represents: 123456", font_size=28, color=YELLOW)
+        decoded_note = cached_text("Represents: 123456", font_size=28, color=YELLOW)
         decoded_note.next_to(de11_ascii, DOWN, buff=0.4)
 
-        scene.play(
-            Transform(de11_hex, de11_ascii),
-            Transform(bcd_note, decoded_note),
-            run_time=0.8
-        )
+        scene.play(Transform(VGroup(de11_hex, bcd_note), VGroup(de11_ascii, decoded_note)), run_time=0.8)
         scene.wait(0.5)
         scene.play(FadeOut(bcd_note))
 
         # Format explanation
-        format_text = Text("Format: N 6 (6-digit numeric, 3 bytes BCD)", font_size=30)
+        format_text = cached_text("Format: N 6 (6-digit numeric, 3 bytes BCD)", font_size=30)
         format_text.next_to(de11_hex, DOWN, buff=0.6)
         scene.play(Write(format_text))
         scene.wait(0.5)
 
         # Breakdown
-        breakdown = Text("Unique transaction identifier for tracking", font_size=32, color=YELLOW)
+        breakdown = cached_text("Unique transaction identifier for tracking", font_size=32, color=YELLOW)
         breakdown.next_to(format_text, DOWN, buff=0.5)
         scene.play(FadeIn(breakdown, shift=UP))
         scene.wait(2)
 
-        scene.play(FadeOut(title), FadeOut(de11_hex), FadeOut(format_text), FadeOut(breakdown))
+        scene.play(FadeOut(Group(title, de11_hex, format_text, breakdown)))
 
     @staticmethod
     def construct_data_types_cheat_sheet(scene):
@@ -592,45 +957,50 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Data Types Cheat Sheet", font_size=40, weight=BOLD)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "Data Types Cheat Sheet")
 
         # Create grid of data types
-        types = VGroup(
-            Text("N — Numeric (0-9)", font_size=24),
-            Text("AN — Alphanumeric (A-Z, 0-9)", font_size=24),
-            Text("ANS — Printable (includes symbols)", font_size=24),
-            Text("B — Binary data", font_size=24),
-            Text("Z — Track data", font_size=24),
-            Text("LLVAR — Variable, 2-digit length", font_size=24, color=YELLOW),
-            Text("LLLVAR — Variable, 3-digit length", font_size=24, color=YELLOW),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
+        types = text_lines(
+            "N — Numeric (0-9)",
+            "AN — Alphanumeric (A-Z, 0-9)",
+            "ANS — Printable (includes symbols)",
+            "B — Binary data",
+            "Z — Track data",
+            "LLVAR — Variable, 2-digit length",
+            "LLLVAR — Variable, 3-digit length",
+            font_size=24,
+        )
+        types[5:].set_color(YELLOW)
         types.move_to(ORIGIN + UP * 0.5)
 
         # Add BCD encoding note
-        bcd_note = Text("Encoding: BCD packs 2 decimal digits per byte",
-                       font_size=26, color=ORANGE, weight=BOLD)
+        bcd_note = cached_text("Encoding: BCD packs 2 decimal digits per byte",
+                              font_size=26, color=ORANGE, weight=BOLD)
         bcd_note.to_edge(DOWN, buff=0.8)
 
-        scene.play(LaggedStart(*[FadeIn(t, shift=RIGHT) for t in types], lag_ratio=0.2))
+        scene.play(lagged_fade_in(types, shift=RIGHT, lag_ratio=0.2))
         scene.wait(1.5)
         scene.play(FadeIn(bcd_note, shift=UP))
         scene.wait(2)
-        scene.play(FadeOut(title), FadeOut(types), FadeOut(bcd_note))
+        scene.play(FadeOut(Group(title, types, bcd_note)))
 
     @staticmethod
     def construct_on_the_wire(scene):
         """Network transmission visualization (20-30s)."""
         add_watermark(scene)
 
+        # Network diagram positions
+        CLIENT_POS = LEFT * 5 + UP * 0.5
+        HOST_POS = RIGHT * 5 + UP * 0.5
+        LINE_START = LEFT * 4.5 + DOWN * 0.5
+        LINE_END = RIGHT * 4.5 + DOWN * 0.5
+        FRAME_LIFT = UP * 0.3
+
         # Title
-        title = Text("On the Wire", font_size=40, weight=BOLD)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "On the Wire")
 
         # Original message (compact)
-        message = Text("36-byte ISO 8583 message (BCD)", font_size=28, color=WHITE)
+        message = cached_text("36-byte ISO 8583 message (BCD)", font_size=28, color=WHITE)
         message_box = SurroundingRectangle(message, color=WHITE, buff=0.2)
         message_group = VGroup(message, message_box)
         message_group.move_to(ORIGIN + UP * 1.5)
@@ -639,47 +1009,46 @@ class ISO8583Scenes:
         scene.wait(0.5)
 
         # Add length prefix
-        prefix = Text(LENGTH_PREFIX_HEX, font_size=36, font="monospace", color=COLOR_LENGTH_PREFIX, weight=BOLD)
+        prefix = cached_text(LENGTH_PREFIX_HEX, font_size=36, font="monospace", color=COLOR_LENGTH_PREFIX, weight=BOLD)
         prefix.next_to(message_group, LEFT, buff=0.4)
 
-        prefix_label = Text("2-byte length", font_size=24, color=COLOR_LENGTH_PREFIX)
+        prefix_label = cached_text("2-byte length", font_size=24, color=COLOR_LENGTH_PREFIX)
         prefix_label.next_to(prefix, UP, buff=0.3)
 
-        decimal_label = Text("(36 decimal)", font_size=24, color=COLOR_LENGTH_PREFIX)
+        decimal_label = cached_text("(36 decimal)", font_size=24, color=COLOR_LENGTH_PREFIX)
         decimal_label.next_to(prefix, DOWN, buff=0.3)
 
         scene.play(FadeIn(prefix, shift=RIGHT), Write(prefix_label), Write(decimal_label))
         scene.wait(1)
 
-        # Clear screen for network diagram
-        scene.play(
-            FadeOut(prefix_label),
-            FadeOut(decimal_label),
-        )
-
         # POS/Client and Host - positioned above the transmission line
-        client = Text("POS/Client", font_size=26)
-        client.move_to(LEFT * 5 + UP * 0.5)
+        client = cached_text("POS/Client", font_size=26)
+        client.move_to(CLIENT_POS)
 
-        host = Text("Host", font_size=26)
-        host.move_to(RIGHT * 5 + UP * 0.5)
+        host = cached_text("Host", font_size=26)
+        host.move_to(HOST_POS)
 
         # Socket line - positioned below the labels
-        socket_line = Line(LEFT * 4.5 + DOWN * 0.5, RIGHT * 4.5 + DOWN * 0.5, color=BLUE, stroke_width=3)
-
-        scene.play(Write(client), Write(host), Create(socket_line))
+        socket_line = Line(LINE_START, LINE_END, color=BLUE, stroke_width=3)
+
+        # Clear the prefix labels while the network diagram is drawn
+        scene.play(AnimationGroup(
+            AnimationGroup(FadeOut(prefix_label), FadeOut(decimal_label)),
+            AnimationGroup(Write(client), Write(host), Create(socket_line)),
+            lag_ratio=0.1,
+        ))
         scene.wait(0.5)
 
         # Scale and position message with prefix at start of transmission line
         combined_frame = VGroup(prefix, message_box, message)
-        scene.play(combined_frame.animate.scale(0.5).move_to(socket_line.get_start() + UP * 0.3))
+        scene.play(combined_frame.animate.scale(0.5).move_to(LINE_START + FRAME_LIFT))
         scene.wait(0.5)
 
         # Animate frame traveling across the line
-        scene.play(combined_frame.animate.move_to(socket_line.get_end() + UP * 0.3), run_time=2.5, rate_func=linear)
+        scene.play(Translate(combined_frame, LINE_END - LINE_START), run_time=2.5, rate_func=linear)
         scene.wait(1)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
     @staticmethod
     def construct_recap_and_pointers(scene):
@@ -687,29 +1056,31 @@ class ISO8583Scenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Recap", font_size=48, weight=BOLD)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "Recap", font_size=48)
 
         # Checklist
-        checklist = VGroup(
-            Text("✓ MTI classifies the message", font_size=28, color=COLOR_MTI),
-            Text("✓ Bitmap lists present fields", font_size=28, color=COLOR_PRIMARY_BITMAP),
-            Text("✓ Fixed vs variable elements", font_size=28, color=COLOR_DATA_ELEMENT),
-            Text("✓ Length prefix for transport", font_size=28, color=COLOR_LENGTH_PREFIX),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+        checklist = text_lines(
+            "✓ MTI classifies the message",
+            "✓ Bitmap lists present fields",
+            "✓ Fixed vs variable elements",
+            "✓ Length prefix for transport",
+            font_size=28,
+            buff=0.4,
+        )
+        for line, color in zip(checklist, (COLOR_MTI, COLOR_PRIMARY_BITMAP, COLOR_DATA_ELEMENT, COLOR_LENGTH_PREFIX)):
+            line.set_color(color)
         checklist.move_to(ORIGIN)
 
-        scene.play(LaggedStart(*[FadeIn(item, shift=UP) for item in checklist], lag_ratio=0.4))
+        scene.play(lagged_fade_in(checklist, shift=UP, lag_ratio=0.4))
         scene.wait(2)
 
         # Final message
-        final = Text("Questions ?", font_size=32)
+        final = cached_text("Questions ?", font_size=32)
         final.next_to(checklist, DOWN, buff=0.8)
         scene.play(FadeIn(final, shift=UP))
         scene.wait(2)
 
-        scene.play(FadeOut(title), FadeOut(checklist), FadeOut(final))
+        scene.play(FadeOut(Group(title, checklist, final)))
 
 
 # =============================================================================
@@ -728,8 +1099,8 @@ class JPOSScenes:
         add_watermark(scene)
 
         # Title with jPOS branding
-        title = Text("jPOS", font_size=60, weight=BOLD, color=COLOR_JPOS_BRAND)
-        subtitle = Text("ISO 8583 toolkit for Java", font_size=32)
+        title = cached_text("jPOS", font_size=60, weight=BOLD, color=COLOR_JPOS_BRAND)
+        subtitle = cached_text("ISO 8583 toolkit for Java", font_size=32)
         subtitle.next_to(title, DOWN, buff=0.4)
 
         title_group = VGroup(title, subtitle)
@@ -740,19 +1111,18 @@ class JPOSScenes:
         scene.wait(0.5)
 
         # Four key components as bubbles
-        components = VGroup(
-            Text("ISOMsg", font_size=28, color=COLOR_ISOMSG, weight=BOLD),
-            Text("Packagers", font_size=28, color=COLOR_PACKAGER, weight=BOLD),
-            Text("Channels", font_size=28, color=COLOR_CHANNEL, weight=BOLD),
-            Text("QMUX", font_size=28, color=COLOR_QMUX, weight=BOLD),
-        ).arrange_in_grid(rows=2, cols=2, buff=0.8)
+        component_colors = [COLOR_ISOMSG, COLOR_PACKAGER, COLOR_CHANNEL, COLOR_QMUX]
+        components = VGroup(*[
+            cached_text(name, font_size=28, color=color, weight=BOLD)
+            for name, color in zip(["ISOMsg", "Packagers", "Channels", "QMUX"], component_colors)
+        ]).arrange_in_grid(rows=2, cols=2, buff=0.8)
         components.move_to(ORIGIN)
 
         # Add surrounding rectangles to create bubbles
-        bubbles = VGroup()
-        for comp in components:
-            bubble = SurroundingRectangle(comp, color=comp.get_color(), buff=0.3, corner_radius=0.2)
-            bubbles.add(VGroup(bubble, comp))
+        bubbles = VGroup(*[
+            VGroup(SurroundingRectangle(comp, color=color, buff=0.3, corner_radius=0.2), comp)
+            for comp, color in zip(components, component_colors)
+        ])
 
         scene.play(LaggedStart(*[FadeIn(bubble, shift=UP, scale=0.8) for bubble in bubbles], lag_ratio=0.2))
         scene.wait(0.8)
@@ -761,14 +1131,14 @@ class JPOSScenes:
         scene.play(FadeOut(bubbles))
 
         bullets = VGroup(
-            Text("• Mature & modular ISO 8583 toolkit", font_size=24),
-            Text("• Pluggable packagers & channels", font_size=24),
-            Text("• Multiplexing (QMUX) for request/response", font_size=24),
-            Text("• Published to Maven Central", font_size=24, color=YELLOW),
+            cached_text("• Mature & modular ISO 8583 toolkit", font_size=24),
+            cached_text("• Pluggable packagers & channels", font_size=24),
+            cached_text("• Multiplexing (QMUX) for request/response", font_size=24),
+            cached_text("• Published to Maven Central", font_size=24, color=YELLOW),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
         bullets.move_to(ORIGIN + DOWN * 0.5)
 
-        scene.play(LaggedStart(*[FadeIn(bullet, shift=RIGHT) for bullet in bullets], lag_ratio=0.3))
+        scene.play(lagged_fade_in(bullets, shift=RIGHT, lag_ratio=0.3))
         scene.wait(2)
         scene.play(FadeOut(title_group), FadeOut(bullets))
 
@@ -778,12 +1148,10 @@ class JPOSScenes:
         add_watermark(scene)
 
         # Title
-        title = Text("ISOMsg & the Composite Pattern", font_size=38, weight=BOLD)
-        title.to_edge(UP)
-        scene.play(Write(title), run_time=0.8)
+        title = write_title(scene, "ISOMsg & the Composite Pattern", font_size=38)
 
         # Root component
-        root_label = Text("ISOComponent", font_size=26, color=COLOR_COMPOSITE, weight=BOLD)
+        root_label = cached_text("ISOComponent", font_size=26, color=COLOR_COMPOSITE, weight=BOLD)
         root_box = SurroundingRectangle(root_label, color=COLOR_COMPOSITE, buff=0.25)
         root = VGroup(root_box, root_label)
         root.move_to(UP * 2)
@@ -792,8 +1160,8 @@ class JPOSScenes:
         scene.wait(0.5)
 
         # Composite node (ISOMsg)
-        composite_label = Text("ISOMsg", font_size=28, color=COLOR_ISOMSG, weight=BOLD)
-        composite_sublabel = Text("(composite)", font_size=18, color=GRAY, slant=ITALIC)
+        composite_label = cached_text("ISOMsg", font_size=28, color=COLOR_ISOMSG, weight=BOLD)
+        composite_sublabel = cached_text("(composite)", font_size=18, color=GRAY, slant=ITALIC)
         composite_sublabel.next_to(composite_label, DOWN, buff=0.1)
         composite_content = VGroup(composite_label, composite_sublabel)
         composite_box = SurroundingRectangle(composite_content, color=COLOR_ISOMSG, buff=0.25)
@@ -801,12 +1169,12 @@ class JPOSScenes:
         composite.move_to(LEFT * 3 + DOWN * 0.5)
 
         # Leaf nodes
-        leaf1_label = Text("ISOField", font_size=24, color=COLOR_ISOMSG)
+        leaf1_label = cached_text("ISOField", font_size=24, color=COLOR_ISOMSG)
         leaf1_box = SurroundingRectangle(leaf1_label, color=COLOR_ISOMSG, buff=0.2)
         leaf1 = VGroup(leaf1_box, leaf1_label)
         leaf1.move_to(RIGHT * 1 + DOWN * 0.5)
 
-        leaf2_label = Text("ISOBitMapField", font_size=24, color=COLOR_ISOMSG)
+        leaf2_label = cached_text("ISOBitMapField", font_size=24, color=COLOR_ISOMSG)
         leaf2_box = SurroundingRectangle(leaf2_label, color=COLOR_ISOMSG, buff=0.2)
         leaf2 = VGroup(leaf2_box, leaf2_label)
         leaf2.next_to(leaf1, RIGHT, buff=0.8)
@@ -816,10 +1184,14 @@ class JPOSScenes:
         line2 = Line(root.get_bottom(), leaf1.get_top(), color=GRAY)
         line3 = Line(root.get_bottom(), leaf2.get_top(), color=GRAY)
 
-        scene.play(Create(line1), Create(line2), Create(line3), run_time=0.8)
-        scene.play(Create(composite_box), Write(composite_content))
-        scene.play(Create(leaf1_box), Write(leaf1_label))
-        scene.play(Create(leaf2_box), Write(leaf2_label))
+        # Connections, then the composite and each leaf in turn
+        scene.play(AnimationGroup(
+            AnimationGroup(Create(line1), Create(line2), Create(line3), run_time=0.8),
+            AnimationGroup(Create(composite_box), Write(composite_content)),
+            AnimationGroup(Create(leaf1_box), Write(leaf1_label)),
+            AnimationGroup(Create(leaf2_box), Write(leaf2_label)),
+            lag_ratio=1,
+        ))
         scene.wait(0.5)
 
         # Pulse composite vs leaves
@@ -833,15 +1205,15 @@ class JPOSScenes:
 
         # Code example overlay
         code_lines = VGroup(
-            Text('ISOMsg m = new ISOMsg();', font_size=26, font="monospace", color=COLOR_ISOMSG),
-            Text('m.setMTI("0800");', font_size=26, font="monospace", color=COLOR_ISOMSG),
-            Text('m.set(3, "000000");', font_size=26, font="monospace", color=COLOR_ISOMSG),
-            Text('m.set(11, "000001");', font_size=26, font="monospace", color=COLOR_ISOMSG),
-            Text('m.set(41, "29110001");', font_size=26, font="monospace", color=COLOR_ISOMSG),
+            cached_text('ISOMsg m = new ISOMsg();', font_size=26, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.setMTI("0800");', font_size=26, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.set(3, "000000");', font_size=26, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.set(11, "000001");', font_size=26, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.set(41, "29110001");', font_size=26, font="monospace", color=COLOR_ISOMSG),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
         code_lines.move_to(ORIGIN)
 
-        scene.play(LaggedStart(*[FadeIn(line, shift=RIGHT) for line in code_lines], lag_ratio=0.3))
+        scene.play(lagged_fade_in(code_lines, shift=RIGHT, lag_ratio=0.3))
         scene.wait(2)
         scene.play(FadeOut(title), FadeOut(code_lines))
 
@@ -851,8 +1223,8 @@ class JPOSScenes:
         add_watermark(scene)
 
         # Phase 1: Introduction
-        title = Text("Packagers in Action", font_size=42, weight=BOLD, color=COLOR_PACKAGER)
-        subtitle = Text("Watch how packagers transform ISOMsg fields into bytes", font_size=24)
+        title = cached_text("Packagers in Action", font_size=42, weight=BOLD, color=COLOR_PACKAGER)
+        subtitle = cached_text("Watch how packagers transform ISOMsg fields into bytes", font_size=24)
         subtitle.next_to(title, DOWN, buff=0.3)
 
         title_group = VGroup(title, subtitle)
@@ -864,24 +1236,7 @@ class JPOSScenes:
         scene.play(title_group.animate.scale(0.7).to_edge(UP))
 
         # Phase 2: Show XML Packager Configuration (left side)
-        xml_lines = [
-            '<isopackager>',
-            '  <isofield id="0" class="IFB_NUMERIC"',
-            '            length="4" name="MTI"/>',
-            '  <isofield id="3" class="IFB_NUMERIC"',
-            '            length="6" name="Processing Code"/>',
-            '  <isofield id="11" class="IFB_NUMERIC"',
-            '            length="6" name="STAN"/>',
-            '  <isofield id="41" class="IFA_NUMERIC"',
-            '            length="8" name="Terminal ID"/>',
-            '</isopackager>',
-        ]
-
-        xml_display = VGroup()
-        for line in xml_lines:
-            text = Text(line, font_size=16, font="monospace", color=COLOR_XML)
-            xml_display.add(text)
-        xml_display.arrange(DOWN, aligned_edge=LEFT, buff=0.05)
+        xml_display = isopackager_xml(16)
         xml_display.move_to(LEFT * 4.3 + UP * 0.5)
         xml_display.scale(0.85)
 
@@ -890,16 +1245,16 @@ class JPOSScenes:
         xml_group = VGroup(xml_box, xml_display)
 
         scene.play(Create(xml_box), run_time=0.5)
-        scene.play(LaggedStart(*[FadeIn(line, shift=RIGHT) for line in xml_display], lag_ratio=0.08))
+        scene.play(lagged_fade_in(xml_display, shift=RIGHT, lag_ratio=0.08))
         scene.wait(0.5)
 
         # Phase 3: Show ISOMsg Code (right side)
         code_lines = VGroup(
-            Text('ISOMsg m = new ISOMsg();', font_size=18, font="monospace", color=COLOR_ISOMSG),
-            Text('m.setMTI("0800");', font_size=18, font="monospace", color=COLOR_ISOMSG),
-            Text('m.set(3, "123456");', font_size=18, font="monospace", color=COLOR_ISOMSG),
-            Text('m.set(11, "000001");', font_size=18, font="monospace", color=COLOR_ISOMSG),
-            Text('m.set(41, "29110001");', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('ISOMsg m = new ISOMsg();', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.setMTI("0800");', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.set(3, "123456");', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.set(11, "000001");', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('m.set(41, "29110001");', font_size=18, font="monospace", color=COLOR_ISOMSG),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         code_lines.move_to(RIGHT * 4.5 + UP * 0.5)
 
@@ -908,11 +1263,11 @@ class JPOSScenes:
         code_group = VGroup(code_box, code_lines)
 
         scene.play(Create(code_box), run_time=0.5)
-        scene.play(LaggedStart(*[FadeIn(line, shift=LEFT) for line in code_lines], lag_ratio=0.15))
+        scene.play(lagged_fade_in(code_lines, shift=LEFT, lag_ratio=0.15))
         scene.wait(0.5)
 
         # Output strip at bottom (initially empty)
-        output_label = Text("Packed bytes:", font_size=20, color=WHITE)
+        output_label = cached_text("Packed bytes:", font_size=20, color=WHITE)
         output_label.to_edge(DOWN, buff=1.5).to_edge(LEFT, buff=1)
         scene.play(FadeIn(output_label))
 
@@ -921,183 +1276,96 @@ class JPOSScenes:
         output_position = output_label.get_right() + RIGHT * 0.5
 
         # Phase 4: Transform each field
-        # Field 0: MTI (BCD)
-        xml_highlight = SurroundingRectangle(VGroup(xml_display[1], xml_display[2]), color=ORANGE, buff=0.1, stroke_width=3)
-        code_highlight = SurroundingRectangle(code_lines[1], color=YELLOW, buff=0.1, stroke_width=3)
-
-        scene.play(Create(xml_highlight), run_time=0.4)
-        scene.play(Create(code_highlight), run_time=0.4)
-        scene.wait(0.3)
-
-        T_ORIGIN = ORIGIN +np.array((0.15, 0.0, 0.0))
-
-        # Transformation in center
-        input_val = Text('"0800"', font_size=36, color=GREEN, weight=BOLD)
-        input_val.move_to(T_ORIGIN + np.array((0.1, 0.0, 0.0)) + UP * 1.2)
-
-        arrow = Text("↓", font_size=40)
-        arrow.next_to(input_val, DOWN, buff=0.2)
-
-        packager_label = Text("IFB_NUMERIC (BCD)", font_size=22, color=COLOR_PACKAGER)
-        packager_label.next_to(arrow, DOWN, buff=0.2)
-
-        output_val = Text("08 00", font_size=36, font="monospace", color=BLUE, weight=BOLD)
-        output_val.next_to(packager_label, DOWN, buff=0.3)
-
-        byte_count = Text("2 bytes", font_size=18, color=GRAY)
-        byte_count.next_to(output_val, DOWN, buff=0.2)
-
-        scene.play(FadeIn(input_val, shift=DOWN))
-        scene.play(FadeIn(arrow), FadeIn(packager_label))
-        scene.play(FadeIn(output_val, shift=DOWN), FadeIn(byte_count))
-        scene.wait(0.5)
-
-        # Add to output strip
-        output_bytes_mti = Text("08 00", font_size=20, font="monospace", color=BLUE, weight=BOLD)
-        output_bytes_mti.move_to(output_position)
-        output_bytes.add(output_bytes_mti)
-
-        # Animate bytes moving to output and highlight
-        scene.play(
-            ReplacementTransform(output_val.copy(), output_bytes_mti),
-            run_time=0.8
-        )
-        highlight_rect = SurroundingRectangle(output_bytes_mti, color=YELLOW, buff=0.1)
-        scene.play(Create(highlight_rect), run_time=0.3)
-        scene.play(FadeOut(highlight_rect), run_time=0.3)
-
-        # Clear transformation area
-        scene.play(FadeOut(input_val), FadeOut(arrow), FadeOut(packager_label),
-                  FadeOut(output_val), FadeOut(byte_count),
-                  FadeOut(xml_highlight), FadeOut(code_highlight), run_time=0.3)
-
-        # Field 3: Processing Code (BCD)
-        xml_highlight = SurroundingRectangle(VGroup(xml_display[3], xml_display[4]), color=ORANGE, buff=0.1, stroke_width=3)
-        code_highlight = SurroundingRectangle(code_lines[2], color=YELLOW, buff=0.1, stroke_width=3)
-
-        scene.play(Create(xml_highlight), Create(code_highlight), run_time=0.4)
-
-        input_val = Text('"123456"', font_size=36, color=GREEN, weight=BOLD)
-        input_val.move_to(T_ORIGIN + UP * 1.2)
-        arrow = Text("↓", font_size=40)
-        arrow.next_to(input_val, DOWN, buff=0.2)
-        packager_label = Text("IFB_NUMERIC (BCD)", font_size=22, color=COLOR_PACKAGER)
-        packager_label.next_to(arrow, DOWN, buff=0.2)
-        output_val = Text("12 34 56", font_size=36, font="monospace", color=BLUE, weight=BOLD)
-        output_val.next_to(packager_label, DOWN, buff=0.3)
-        byte_count = Text("3 bytes", font_size=18, color=GRAY)
-        byte_count.next_to(output_val, DOWN, buff=0.2)
-
-        scene.play(FadeIn(input_val, shift=DOWN))
-        scene.play(FadeIn(arrow), FadeIn(packager_label))
-        scene.play(FadeIn(output_val, shift=DOWN), FadeIn(byte_count))
-        scene.wait(0.5)
-
-        # Add to output strip
-        output_bytes_f3 = Text("12 34 56", font_size=20, font="monospace", color=BLUE, weight=BOLD)
-        output_bytes_f3.next_to(output_bytes_mti, RIGHT, buff=0.3)
-        output_bytes.add(output_bytes_f3)
-
-        # Animate and highlight
-        scene.play(
-            ReplacementTransform(output_val.copy(), output_bytes_f3),
-            run_time=0.8
-        )
-        highlight_rect = SurroundingRectangle(output_bytes_f3, color=YELLOW, buff=0.1)
-        scene.play(Create(highlight_rect), run_time=0.3)
-        scene.play(FadeOut(highlight_rect), run_time=0.3)
-
-        scene.play(FadeOut(input_val), FadeOut(arrow), FadeOut(packager_label),
-                  FadeOut(output_val), FadeOut(byte_count),
-                  FadeOut(xml_highlight), FadeOut(code_highlight), run_time=0.3)
-
-        # Field 11: STAN (BCD)
-        xml_highlight = SurroundingRectangle(VGroup(xml_display[5], xml_display[6]), color=ORANGE, buff=0.1, stroke_width=3)
-        code_highlight = SurroundingRectangle(code_lines[3], color=YELLOW, buff=0.1, stroke_width=3)
-
-        scene.play(Create(xml_highlight), Create(code_highlight), run_time=0.4)
-
-        input_val = Text('"000001"', font_size=36, color=GREEN, weight=BOLD)
-        input_val.move_to(T_ORIGIN + UP * 1.2)
-        arrow = Text("↓", font_size=40)
-        arrow.next_to(input_val, DOWN, buff=0.2)
-        packager_label = Text("IFB_NUMERIC (BCD)", font_size=22, color=COLOR_PACKAGER)
-        packager_label.next_to(arrow, DOWN, buff=0.2)
-        output_val = Text("00 00 01", font_size=36, font="monospace", color=BLUE, weight=BOLD)
-        output_val.next_to(packager_label, DOWN, buff=0.3)
-        byte_count = Text("3 bytes", font_size=18, color=GRAY)
-        byte_count.next_to(output_val, DOWN, buff=0.2)
-
-        scene.play(FadeIn(input_val, shift=DOWN))
-        scene.play(FadeIn(arrow), FadeIn(packager_label))
-        scene.play(FadeIn(output_val, shift=DOWN), FadeIn(byte_count))
-        scene.wait(0.5)
-
-        # Add to output strip
-        output_bytes_f11 = Text("00 00 01", font_size=20, font="monospace", color=BLUE, weight=BOLD)
-        output_bytes_f11.next_to(output_bytes_f3, RIGHT, buff=0.3)
-        output_bytes.add(output_bytes_f11)
-
-        # Animate and highlight
-        scene.play(
-            ReplacementTransform(output_val.copy(), output_bytes_f11),
-            run_time=0.8
-        )
-        highlight_rect = SurroundingRectangle(output_bytes_f11, color=YELLOW, buff=0.1)
-        scene.play(Create(highlight_rect), run_time=0.3)
-        scene.play(FadeOut(highlight_rect), run_time=0.3)
-
-        scene.play(FadeOut(input_val), FadeOut(arrow), FadeOut(packager_label),
-                  FadeOut(output_val), FadeOut(byte_count),
-                  FadeOut(xml_highlight), FadeOut(code_highlight), run_time=0.3)
-
-        # Field 41: Terminal ID (ASCII - contrast!)
-        xml_highlight = SurroundingRectangle(VGroup(xml_display[7], xml_display[8]), color=ORANGE, buff=0.1, stroke_width=3)
-        code_highlight = SurroundingRectangle(code_lines[4], color=YELLOW, buff=0.1, stroke_width=3)
-
-        scene.play(Create(xml_highlight), Create(code_highlight), run_time=0.4)
-
-        input_val = Text('"29110001"', font_size=36, color=GREEN, weight=BOLD)
-        input_val.move_to(T_ORIGIN + UP * 1.2)
-        arrow = Text("↓", font_size=40)
-        arrow.next_to(input_val, DOWN, buff=0.2)
-        packager_label = Text("IFA_NUMERIC (ASCII)", font_size=22, color=COLOR_PACKAGER, weight=BOLD)
-        packager_label.next_to(arrow, DOWN, buff=0.2)
-        output_val = Text("32 39 31 31 30 30 30 31", font_size=16, font="monospace", color=GREEN, weight=BOLD)
-        output_val.next_to(packager_label, DOWN, buff=0.3)
-        byte_count = Text("8 bytes (1 byte per digit!)", font_size=18, color=YELLOW)
-        byte_count.next_to(output_val, DOWN, buff=0.2)
-
-        scene.play(FadeIn(input_val, shift=DOWN))
-        scene.play(FadeIn(arrow), FadeIn(packager_label))
-        scene.play(FadeIn(output_val, shift=DOWN), FadeIn(byte_count))
-        scene.wait(0.8)
+        # xml: first line of the field's two-line <isofield> entry; ascii fields get the IFA contrast styling
+        fields = [
+            {'xml': 1, 'code': 1, 'value': '"0800"', 'packager': "IFB_NUMERIC (BCD)",
+             'packed': "08 00", 'bytes': "2 bytes", 'ascii': False},
+            {'xml': 3, 'code': 2, 'value': '"123456"', 'packager': "IFB_NUMERIC (BCD)",
+             'packed': "12 34 56", 'bytes': "3 bytes", 'ascii': False},
+            {'xml': 5, 'code': 3, 'value': '"000001"', 'packager': "IFB_NUMERIC (BCD)",
+             'packed': "00 00 01", 'bytes': "3 bytes", 'ascii': False},
+            {'xml': 7, 'code': 4, 'value': '"29110001"', 'packager': "IFA_NUMERIC (ASCII)",
+             'packed': "32 39 31 31 30 30 30 31", 'bytes': "8 bytes (1 byte per digit!)", 'ascii': True},
+        ]
 
-        # Add to output strip
-        output_bytes_f41 = Text("32 39 31 31 30 30 30 31", font_size=20, font="monospace", color=GREEN, weight=BOLD)
-        output_bytes_f41.next_to(output_bytes_f11, RIGHT, buff=0.3)
-        output_bytes.add(output_bytes_f41)
+        # Transformation area: the input value sits above its packager and output;
+        # the MTI value is nudged slightly right of the others
+        T_ORIGIN = ORIGIN + RIGHT * 0.15
+        INPUT_POS = T_ORIGIN + UP * 1.2
+        MTI_INPUT_POS = INPUT_POS + RIGHT * 0.1
+
+        for index, field in enumerate(fields):
+            line = field['xml']
+            xml_highlight = SurroundingRectangle(VGroup(xml_display[line], xml_display[line + 1]), color=ORANGE, buff=0.1, stroke_width=3)
+            code_highlight = SurroundingRectangle(code_lines[field['code']], color=YELLOW, buff=0.1, stroke_width=3)
+
+            # The highlights only mark the current field, so they appear as a cut
+            # (static frames) instead of being traced with Create
+            if index == 0:
+                scene.add(xml_highlight)
+                scene.wait(0.4)
+                scene.add(code_highlight)
+                scene.wait(0.4 + 0.3)
+            else:
+                scene.add(xml_highlight, code_highlight)
+                scene.wait(0.4)
+
+            ascii_field = field['ascii']
+            packed_color = GREEN if ascii_field else BLUE
+
+            # Transformation in center
+            input_val = cached_text(field['value'], font_size=36, color=GREEN, weight=BOLD)
+            input_val.move_to(MTI_INPUT_POS if index == 0 else INPUT_POS)
+
+            arrow = cached_text("↓", font_size=40)
+            arrow.next_to(input_val, DOWN, buff=0.2)
+
+            packager_label = cached_text(field['packager'], font_size=22, color=COLOR_PACKAGER,
+                                         weight=BOLD if ascii_field else NORMAL)
+            packager_label.next_to(arrow, DOWN, buff=0.2)
+
+            output_val = cached_text(field['packed'], font_size=16 if ascii_field else 36, font="monospace",
+                                     color=packed_color, weight=BOLD)
+            output_val.next_to(packager_label, DOWN, buff=0.3)
+
+            byte_count = cached_text(field['bytes'], font_size=18, color=YELLOW if ascii_field else GRAY)
+            byte_count.next_to(output_val, DOWN, buff=0.2)
+
+            # input, then arrow + packager, then output + byte count, one second each
+            scene.play(AnimationGroup(
+                FadeIn(input_val, shift=DOWN),
+                AnimationGroup(FadeIn(arrow), FadeIn(packager_label)),
+                AnimationGroup(FadeIn(output_val, shift=DOWN), FadeIn(byte_count)),
+                lag_ratio=1,
+            ))
+            scene.wait(0.8 if ascii_field else 0.5)
+
+            # Add to output strip
+            field_bytes = cached_text(field['packed'], font_size=20, font="monospace", color=packed_color, weight=BOLD)
+            if len(output_bytes):
+                field_bytes.next_to(output_bytes[-1], RIGHT, buff=0.3)
+            else:
+                field_bytes.move_to(output_position)
+            output_bytes.add(field_bytes)
 
-        # Animate and highlight
-        scene.play(
-            ReplacementTransform(output_val.copy(), output_bytes_f41),
-            run_time=0.8
-        )
-        highlight_rect = SurroundingRectangle(output_bytes_f41, color=YELLOW, buff=0.1)
-        scene.play(Create(highlight_rect), run_time=0.3)
-        scene.play(FadeOut(highlight_rect), run_time=0.3)
+            # Animate bytes moving to output and highlight; output_val stays in
+            # the center until the area is cleared, so a copy makes the trip
+            scene.play(TransformFromCopy(output_val, field_bytes), run_time=0.8)
+            highlight_rect = SurroundingRectangle(field_bytes, color=YELLOW, buff=0.1)
+            scene.play(Create(highlight_rect), run_time=0.3)
+            scene.play(FadeOut(highlight_rect), run_time=0.3)
 
-        scene.play(FadeOut(input_val), FadeOut(arrow), FadeOut(packager_label),
-                  FadeOut(output_val), FadeOut(byte_count),
-                  FadeOut(xml_highlight), FadeOut(code_highlight), run_time=0.3)
+            # Clear transformation area
+            scene.play(FadeOut(Group(input_val, arrow, packager_label, output_val, byte_count,
+                                     xml_highlight, code_highlight)), run_time=0.3)
 
         # Phase 5: Show complete message
-        total_bytes = Text("Total: 16 bytes (2+3+3+8)", font_size=24, color=YELLOW, weight=BOLD)
+        total_bytes = cached_text("Total: 16 bytes (2+3+3+8)", font_size=24, color=YELLOW, weight=BOLD)
         total_bytes.move_to(ORIGIN + DOWN * 0.5 + RIGHT * 0.15)
 
         comparison = VGroup(
-            Text("IFB (BCD): 2 digits per byte", font_size=20, color=BLUE),
-            Text("IFA (ASCII): 1 digit per byte", font_size=20, color=GREEN),
+            cached_text("IFB (BCD): 2 digits per byte", font_size=20, color=BLUE),
+            cached_text("IFA (ASCII): 1 digit per byte", font_size=20, color=GREEN),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         comparison.next_to(total_bytes, DOWN, buff=0.5)
 
@@ -1107,7 +1375,7 @@ class JPOSScenes:
         scene.play(FadeIn(comparison, shift=UP))
         scene.wait(2)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
     @staticmethod
     def construct_packager_definition(scene):
@@ -1115,54 +1383,41 @@ class JPOSScenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Packager Configuration", font_size=40, weight=BOLD)
+        title = cached_text("Packager Configuration", font_size=40, weight=BOLD)
         title.to_edge(UP)
         scene.play(Write(title), run_time=0.8)
 
         # XML snippet
-        xml_lines = [
-            '<isopackager>',
-            '  <isofield id="0" length="4" name="MESSAGE TYPE INDICATOR" class="org.jpos.iso.IFB_NUMERIC" />',
-            '  <isofield id="3" length="6" name="PROCESSING CODE" class="org.jpos.iso.IFB_NUMERIC" />',
-            '  <isofield id="11" length="6" name="STAN" class="org.jpos.iso.IFB_NUMERIC" />',
-            '  <isofield id="41" length="8" name="TERMINAL ID" class="org.jpos.iso.IFA_NUMERIC" />',
-            '</isopackager>',
-        ]
-
-        xml_display = VGroup()
-        for line in xml_lines:
-            text = Text(line, font_size=14, font="monospace", color=COLOR_XML)
-            xml_display.add(text)
-        xml_display.arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        xml_display = isopackager_xml(14, one_line=True, buff=0.25)
         xml_display.scale(1.1)
         xml_display.move_to(ORIGIN + UP * 0.2)
 
-        scene.play(LaggedStart(*[FadeIn(line, shift=RIGHT) for line in xml_display], lag_ratio=0.1))
+        scene.play(lagged_fade_in(xml_display, shift=RIGHT, lag_ratio=0.1))
         scene.wait(0.5)
 
-        # Highlight key field lines (one line per field now)
-        highlights = []
-        for i in [1, 2, 3, 4]:  # Field definitions at indices 1-4
-            rect = SurroundingRectangle(xml_display[i], color=YELLOW, buff=0.1)
-            highlights.append(rect)
-
-        for i, rect in enumerate(highlights):
-            if i == 0:
-                scene.play(Create(rect), run_time=0.5)
-            else:
-                scene.play(ReplacementTransform(highlights[i-1], rect), run_time=0.5)
-            scene.wait(2)  # 2 seconds per field
-        scene.play(FadeOut(highlights[-1]))
+        # Walk one highlight over the field lines (one line per field, indices 1-4)
+        highlight = SurroundingRectangle(xml_display[1], color=YELLOW, buff=0.1)
+        scene.play(Create(highlight), run_time=0.5)
+        scene.wait(2)  # 2 seconds per field
+        for line in xml_display[2:5]:
+            scene.play(
+                highlight.animate.stretch_to_fit_width(line.width + 0.2)
+                .stretch_to_fit_height(line.height + 0.2)
+                .move_to(line),
+                run_time=0.5
+            )
+            scene.wait(2)
+        scene.play(FadeOut(highlight))
         scene.wait(0.5)
 
         # Caption
-        caption = Text("GenericPackager: XML-based configuration", font_size=26, color=COLOR_PACKAGER)
+        caption = cached_text("GenericPackager: XML-based configuration", font_size=26, color=COLOR_PACKAGER)
         caption.to_edge(DOWN, buff=1)
         scene.play(FadeIn(caption, shift=UP))
         scene.wait(1)
 
         # Alternative badge
-        alt_badge = Text("Or extend ISOBasePackager in Java", font_size=24, color=GRAY, slant=ITALIC)
+        alt_badge = cached_text("Or extend ISOBasePackager in Java", font_size=24, color=GRAY, slant=ITALIC)
         alt_badge.next_to(caption, DOWN, buff=0.3)
         scene.play(FadeIn(alt_badge))
         scene.wait(1)
@@ -1174,12 +1429,12 @@ class JPOSScenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Composite Subfields: DE 3 Example", font_size=38, weight=BOLD)
+        title = cached_text("Composite Subfields: DE 3 Example", font_size=38, weight=BOLD)
         title.to_edge(UP)
         scene.play(Write(title), run_time=0.8)
 
         # LEFT SIDE: DE 3 label at top
-        de3_label = Text("DE 3: Processing Code (N 6)", font_size=26, color=COLOR_DATA_ELEMENT, weight=BOLD)
+        de3_label = cached_text("DE 3: Processing Code (N 6)", font_size=26, color=COLOR_DATA_ELEMENT, weight=BOLD)
         de3_box = SurroundingRectangle(de3_label, color=COLOR_DATA_ELEMENT, buff=0.25)
         de3_group = VGroup(de3_box, de3_label)
         de3_group.move_to(LEFT * 3.5 + UP * 1.8)
@@ -1188,17 +1443,17 @@ class JPOSScenes:
         scene.wait(0.8)
 
         # LEFT SIDE: 3 subfields with aligned '=' signs
-        subfield1_text = Text("Transaction Code(2)  = \"01\"", font_size=20, font="monospace", color=GREEN)
+        subfield1_text = cached_text("Transaction Code(2)  = \"01\"", font_size=20, font="monospace", color=GREEN)
         subfield1_box = SurroundingRectangle(subfield1_text, color=GREEN, buff=0.2)
         subfield1 = VGroup(subfield1_box, subfield1_text)
         subfield1.next_to(de3_group, DOWN, buff=0.6)
 
-        subfield2_text = Text("Account-From(2)      = \"02\"", font_size=20, font="monospace", color=GREEN)
+        subfield2_text = cached_text("Account-From(2)      = \"02\"", font_size=20, font="monospace", color=GREEN)
         subfield2_box = SurroundingRectangle(subfield2_text, color=GREEN, buff=0.2)
         subfield2 = VGroup(subfield2_box, subfield2_text)
         subfield2.next_to(subfield1, DOWN, buff=0.5)
 
-        subfield3_text = Text("Account-To(2)        = \"03\"", font_size=20, font="monospace", color=GREEN)
+        subfield3_text = cached_text("Account-To(2)        = \"03\"", font_size=20, font="monospace", color=GREEN)
         subfield3_box = SurroundingRectangle(subfield3_text, color=GREEN, buff=0.2)
         subfield3 = VGroup(subfield3_box, subfield3_text)
         subfield3.next_to(subfield2, DOWN, buff=0.5)
@@ -1215,12 +1470,12 @@ class JPOSScenes:
 
         # RIGHT SIDE: XML packager configuration
         xml_snippet = VGroup(
-            Text('<isofield id="3" name="PROCESSING CODE"', font_size=18, font="monospace", color=COLOR_XML),
-            Text('  packager="GenericSubFieldPackager">', font_size=18, font="monospace", color=COLOR_XML),
-            Text('    <isofield id="1" length="2" name="TX_CODE" />', font_size=18, font="monospace", color=COLOR_XML),
-            Text('    <isofield id="2" length="2" name="ACCT_FROM" />', font_size=18, font="monospace", color=COLOR_XML),
-            Text('    <isofield id="3" length="2" name="ACCT_TO" />', font_size=18, font="monospace", color=COLOR_XML),
-            Text('</isofield>', font_size=18, font="monospace", color=COLOR_XML),
+            cached_text('<isofield id="3" name="PROCESSING CODE"', font_size=18, font="monospace", color=COLOR_XML),
+            cached_text('  packager="GenericSubFieldPackager">', font_size=18, font="monospace", color=COLOR_XML),
+            cached_text('    <isofield id="1" length="2" name="TX_CODE" />', font_size=18, font="monospace", color=COLOR_XML),
+            cached_text('    <isofield id="2" length="2" name="ACCT_FROM" />', font_size=18, font="monospace", color=COLOR_XML),
+            cached_text('    <isofield id="3" length="2" name="ACCT_TO" />', font_size=18, font="monospace", color=COLOR_XML),
+            cached_text('</isofield>', font_size=18, font="monospace", color=COLOR_XML),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.12)
         xml_snippet.move_to(RIGHT * 3.5 + UP * 1.2)
 
@@ -1229,9 +1484,9 @@ class JPOSScenes:
 
         # RIGHT SIDE: Code example below XML
         code_example = VGroup(
-            Text('msg.set(3, 1, "01");', font_size=18, font="monospace", color=COLOR_ISOMSG),
-            Text('msg.set(3, 2, "02");', font_size=18, font="monospace", color=COLOR_ISOMSG),
-            Text('msg.set(3, 3, "03");', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('msg.set(3, 1, "01");', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('msg.set(3, 2, "02");', font_size=18, font="monospace", color=COLOR_ISOMSG),
+            cached_text('msg.set(3, 3, "03");', font_size=18, font="monospace", color=COLOR_ISOMSG),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
 
         # Background box for code
@@ -1243,12 +1498,12 @@ class JPOSScenes:
         scene.wait(1)
 
         # Bottom: Recombination result (centered, at the very bottom)
-        combined = Text("Packed: 010203 → 01 02 03 (3 BCD bytes)", font_size=24, color=COLOR_DATA_ELEMENT, weight=BOLD)
+        combined = cached_text("Packed: 010203 → 01 02 03 (3 BCD bytes)", font_size=24, color=COLOR_DATA_ELEMENT, weight=BOLD)
         combined.to_edge(DOWN, buff=0.8)
 
         scene.play(FadeIn(combined, shift=UP))
         scene.wait(2)
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
     @staticmethod
     def construct_byte_packing(scene):
@@ -1256,23 +1511,23 @@ class JPOSScenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Encoding in Action", font_size=40, weight=BOLD)
+        title = cached_text("Encoding in Action", font_size=40, weight=BOLD)
         title.to_edge(UP)
         scene.play(Write(title), run_time=0.8)
 
         # Cut 1 - MTI encoding comparison
-        cut1_title = Text("MTI Encoding", font_size=32, color=COLOR_MTI, weight=BOLD)
+        cut1_title = cached_text("MTI Encoding", font_size=32, color=COLOR_MTI, weight=BOLD)
         cut1_title.move_to(UP * 2)
 
         ascii_encoding = VGroup(
-            Text("IFA_NUMERIC (ASCII)", font_size=24, color=COLOR_PACKAGER),
-            Text('"0100" → 30 31 30 30 (4 bytes)', font_size=26, font="monospace", color=GREEN),
+            cached_text("IFA_NUMERIC (ASCII)", font_size=24, color=COLOR_PACKAGER),
+            cached_text('"0100" → 30 31 30 30 (4 bytes)', font_size=26, font="monospace", color=GREEN),
         ).arrange(DOWN, buff=0.3)
         ascii_encoding.move_to(UP * 0.8)
 
         bcd_encoding = VGroup(
-            Text("IFB_NUMERIC (BCD)", font_size=24, color=COLOR_PACKAGER),
-            Text('"0100" → 01 00 (2 bytes)', font_size=26, font="monospace", color=YELLOW),
+            cached_text("IFB_NUMERIC (BCD)", font_size=24, color=COLOR_PACKAGER),
+            cached_text('"0100" → 01 00 (2 bytes)', font_size=26, font="monospace", color=YELLOW),
         ).arrange(DOWN, buff=0.3)
         bcd_encoding.move_to(DOWN * 0.5)
 
@@ -1288,21 +1543,20 @@ class JPOSScenes:
         scene.play(FadeOut(cut1_title), FadeOut(ascii_encoding), FadeOut(bcd_encoding))
 
         # LLVAR packing
-        cut3_title = Text("DE 2 LLVAR Packing", font_size=32, color=COLOR_DATA_ELEMENT, weight=BOLD)
+        cut3_title = cached_text("DE 2 LLVAR Packing", font_size=32, color=COLOR_DATA_ELEMENT, weight=BOLD)
         cut3_title.move_to(UP * 2)
 
         # Create the full encoded line with proper spacing
-        encoded_full = Text("Encoded: 16 45 39 68 12 34 56 78 90", font_size=22, font="monospace")
+        encoded_full = cached_text("Encoded: 16 45 39 68 12 34 56 78 90", font_size=22, font="monospace")
 
-        # Color the "16" part in yellow, rest in green/white
-        encoded_full[0:8].set_color(WHITE)  # "Encoded:"
+        # Color the "16" part in yellow, the hex bytes green; "Encoded:" stays white
         encoded_full[8:10].set_color(YELLOW)  # "16"
         encoded_full[8:10].set_weight(BOLD)  # Make "16" bold
         encoded_full[10:].set_color(GREEN)  # Rest of the hex bytes
 
         llvar_packing = VGroup(
-            Text('"4539681234567890" (16 digits)', font_size=24),
-            Text("↓", font_size=30),
+            cached_text('"4539681234567890" (16 digits)', font_size=24),
+            cached_text("↓", font_size=30),
             encoded_full,
         ).arrange(DOWN, buff=0.3)
         llvar_packing.move_to(ORIGIN)
@@ -1311,15 +1565,16 @@ class JPOSScenes:
 
         # Add length annotation below, positioned under the "16"
         # The "16" starts at character index 9, so we align under that
-        length_annotation = Text("   └─ Length (1 byte BCD)", font_size=20, color=YELLOW)
+        length_annotation = cached_text("   └─ Length (1 byte BCD)", font_size=20, color=YELLOW)
         length_annotation.next_to(encoded_full, DOWN, buff=0.2)
         length_annotation.align_to(target_digit, LEFT)
         llvar_packing.add(length_annotation)
 
         scene.play(Write(cut3_title))
-        scene.play(LaggedStart(*[FadeIn(item, shift=DOWN) for item in llvar_packing], lag_ratio=0.3))
+        scene.play(lagged_fade_in(llvar_packing, shift=DOWN, lag_ratio=0.3))
         scene.wait(2)
-        scene.play(FadeOut(title), *[FadeOut(mob) for mob in scene.mobjects[1:]])
+        # Everything but the watermark; the title is already in mobjects[1:]
+        scene.play(FadeOut(Group(*scene.mobjects[1:])))
 
     @staticmethod
     def construct_channels(scene):
@@ -1327,93 +1582,93 @@ class JPOSScenes:
         add_watermark(scene)
 
         # Title
-        title = Text("Channels: Wire Protocol Adapters", font_size=38, weight=BOLD)
+        title = cached_text("Channels: Wire Protocol Adapters", font_size=38, weight=BOLD)
         title.to_edge(UP)
         scene.play(Write(title), run_time=0.8)
 
         # Section 1: ISOChannel Interface (8s)
-        interface_title = Text("ISOChannel Interface", font_size=30, color=COLOR_CHANNEL, weight=BOLD)
+        interface_title = cached_text("ISOChannel Interface", font_size=30, color=COLOR_CHANNEL, weight=BOLD)
         interface_title.move_to(UP * 2.2)
 
         interface_methods = VGroup(
-            Text("send(ISOMsg)", font_size=24, font="monospace", color=COLOR_ISOMSG),
-            Text("receive() → ISOMsg", font_size=24, font="monospace", color=COLOR_ISOMSG),
-            Text("setPackager(ISOPackager)", font_size=24, font="monospace", color=COLOR_PACKAGER),
+            cached_text("send(ISOMsg)", font_size=24, font="monospace", color=COLOR_ISOMSG),
+            cached_text("receive() → ISOMsg", font_size=24, font="monospace", color=COLOR_ISOMSG),
+            cached_text("setPackager(ISOPackager)", font_size=24, font="monospace", color=COLOR_PACKAGER),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
         interface_methods.move_to(UP * 0.8)
 
-        tagline = Text("Abstracts the wire protocol", font_size=26, color=YELLOW, slant=ITALIC)
+        tagline = cached_text("Abstracts the wire protocol", font_size=26, color=YELLOW, slant=ITALIC)
         tagline.next_to(interface_methods, DOWN, buff=0.6)
 
         scene.play(FadeOut(title))  # Fade out main title
         scene.play(Write(interface_title))
-        scene.play(LaggedStart(*[FadeIn(method, shift=RIGHT) for method in interface_methods], lag_ratio=0.3))
+        scene.play(lagged_fade_in(interface_methods, shift=RIGHT, lag_ratio=0.3))
         scene.play(FadeIn(tagline, shift=UP))
         scene.wait(1.5)
-        scene.play(FadeOut(interface_title), FadeOut(interface_methods), FadeOut(tagline))
+        scene.play(FadeOut(Group(interface_title, interface_methods, tagline)))
 
         # Section 2: Common Channel Types (12s)
-        channels_title = Text("Common jPOS Channels", font_size=32, weight=BOLD)
+        channels_title = cached_text("Common jPOS Channels", font_size=32, weight=BOLD)
         channels_title.to_edge(UP, buff=0.8)
         scene.play(Write(channels_title))
 
         channel_types = VGroup(
             VGroup(
-                Text("NACChannel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
-                Text("— Network Application Channel", font_size=22, color=GRAY)
+                cached_text("NACChannel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
+                cached_text("— Network Application Channel", font_size=22, color=GRAY)
             ).arrange(RIGHT, buff=0.3),
             VGroup(
-                Text("BASE24Channel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
-                Text("— ACI BASE24 protocol", font_size=22, color=GRAY)
+                cached_text("BASE24Channel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
+                cached_text("— ACI BASE24 protocol", font_size=22, color=GRAY)
             ).arrange(RIGHT, buff=0.3),
             VGroup(
-                Text("ASCIIChannel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
-                Text("— ASCII with 4-byte length header", font_size=22, color=GRAY)
+                cached_text("ASCIIChannel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
+                cached_text("— ASCII with 4-byte length header", font_size=22, color=GRAY)
             ).arrange(RIGHT, buff=0.3),
             VGroup(
-                Text("XMLChannel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
-                Text("— XML-formatted messages", font_size=22, color=GRAY)
+                cached_text("XMLChannel", font_size=26, color=COLOR_CHANNEL, weight=BOLD),
+                cached_text("— XML-formatted messages", font_size=22, color=GRAY)
             ).arrange(RIGHT, buff=0.3),
             VGroup(
-                Text("LoopbackChannel", font_size=26, color=GRAY, weight=BOLD),
-                Text("— Testing and simulation", font_size=22, color=GRAY)
+                cached_text("LoopbackChannel", font_size=26, color=GRAY, weight=BOLD),
+                cached_text("— Testing and simulation", font_size=22, color=GRAY)
             ).arrange(RIGHT, buff=0.3),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.35)
         channel_types.move_to(ORIGIN + DOWN * 0.2)
 
-        scene.play(LaggedStart(*[FadeIn(ch, shift=RIGHT) for ch in channel_types], lag_ratio=0.25))
+        scene.play(lagged_fade_in(channel_types, shift=RIGHT, lag_ratio=0.25))
         scene.wait(2.5)
-        scene.play(FadeOut(channels_title), FadeOut(channel_types))
+        scene.play(FadeOut(Group(channels_title, channel_types)))
 
         # Section 3: Channel Components (10s)
-        components_title = Text("Channel Components", font_size=32, weight=BOLD)
+        components_title = cached_text("Channel Components", font_size=32, weight=BOLD)
         components_title.to_edge(UP, buff=0.8)
         scene.play(Write(components_title))
 
         # Center: Channel box
         channel_box = Rectangle(width=2.5, height=1.2, color=COLOR_CHANNEL, stroke_width=3)
-        channel_label = Text("Channel", font_size=26, color=COLOR_CHANNEL, weight=BOLD)
+        channel_label = cached_text("Channel", font_size=26, color=COLOR_CHANNEL, weight=BOLD)
         channel_label.move_to(channel_box.get_center())
         channel_group = VGroup(channel_box, channel_label)
         channel_group.move_to(ORIGIN)
 
         # Packager component (left)
-        packager_label = Text("Packager", font_size=22, color=COLOR_PACKAGER, weight=BOLD)
-        packager_desc = Text("ISOMsg ↔ bytes", font_size=18, color=COLOR_PACKAGER)
+        packager_label = cached_text("Packager", font_size=22, color=COLOR_PACKAGER, weight=BOLD)
+        packager_desc = cached_text("ISOMsg ↔ bytes", font_size=18, color=COLOR_PACKAGER)
         packager_desc.next_to(packager_label, DOWN, buff=0.2)
         packager_group = VGroup(packager_label, packager_desc)
         packager_group.move_to(LEFT * 4 + UP * 0.5)
 
         # Endpoint component (right top)
-        endpoint_label = Text("Endpoint", font_size=22, color=BLUE, weight=BOLD)
-        endpoint_desc = Text("host:port", font_size=18, color=BLUE)
+        endpoint_label = cached_text("Endpoint", font_size=22, color=BLUE, weight=BOLD)
+        endpoint_desc = cached_text("host:port", font_size=18, color=BLUE)
         endpoint_desc.next_to(endpoint_label, DOWN, buff=0.2)
         endpoint_group = VGroup(endpoint_label, endpoint_desc)
         endpoint_group.move_to(RIGHT * 4 + UP * 0.5)
 
         # Filters component (right bottom)
-        filters_label = Text("Filters", font_size=22, color=YELLOW, weight=BOLD)
-        filters_desc = Text("incoming/outgoing", font_size=18, color=YELLOW)
+        filters_label = cached_text("Filters", font_size=22, color=YELLOW, weight=BOLD)
+        filters_desc = cached_text("incoming/outgoing", font_size=18, color=YELLOW)
         filters_desc.next_to(filters_label, DOWN, buff=0.2)
         filters_group = VGroup(filters_label, filters_desc)
         filters_group.move_to(RIGHT * 4 + DOWN * 1.2)
@@ -1428,56 +1683,59 @@ class JPOSScenes:
         scene.play(Create(line2), FadeIn(endpoint_group, shift=LEFT))
         scene.play(Create(line3), FadeIn(filters_group, shift=LEFT))
         scene.wait(2)
-        scene.play(FadeOut(components_title), FadeOut(channel_group), FadeOut(packager_group),
-                  FadeOut(endpoint_group), FadeOut(filters_group),
-                  FadeOut(line1), FadeOut(line2), FadeOut(line3))
+        scene.play(FadeOut(Group(components_title, channel_group, packager_group,
+                                 endpoint_group, filters_group, line1, line2, line3)))
 
         # Section 4: Code Example (15s)
-        code_title = Text("Send & Receive", font_size=32, weight=BOLD)
+        code_title = cached_text("Send & Receive", font_size=32, weight=BOLD)
         code_title.to_edge(UP, buff=0.8)
         scene.play(Write(code_title))
 
-        code_lines = VGroup(
-            Text('ISOChannel channel = new NACChannel(', font_size=20, font="monospace", color=COLOR_CHANNEL),
-            Text('    host, port, packager', font_size=20, font="monospace", color=GRAY),
-            Text(');', font_size=20, font="monospace", color=WHITE),
-            Text('channel.connect();', font_size=20, font="monospace", color=COLOR_CHANNEL),
-            Text('channel.send(msg);', font_size=20, font="monospace", color=COLOR_ISOMSG),
-            Text('ISOMsg response = channel.receive();', font_size=20, font="monospace", color=COLOR_ISOMSG),
-            Text('channel.disconnect();', font_size=20, font="monospace", color=COLOR_CHANNEL),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        code_lines = text_lines(
+            'ISOChannel channel = new NACChannel(',
+            '    host, port, packager',
+            ');',
+            'channel.connect();',
+            'channel.send(msg);',
+            'ISOMsg response = channel.receive();',
+            'channel.disconnect();',
+            font_size=20, font="monospace", buff=0.25,
+        )
+        code_colors = [COLOR_CHANNEL, GRAY, WHITE, COLOR_CHANNEL, COLOR_ISOMSG, COLOR_ISOMSG, COLOR_CHANNEL]
+        for line, color in zip(code_lines, code_colors):
+            line.set_color(color)
         code_lines.move_to(ORIGIN)
 
         # Comment annotations
-        send_comment = Text("// Send request", font_size=18, color=GREEN, slant=ITALIC)
+        send_comment = cached_text("// Send request", font_size=18, color=GREEN, slant=ITALIC)
         send_comment.next_to(code_lines[4], RIGHT, buff=0.5)
 
-        receive_comment = Text("// Wait for response", font_size=18, color=GREEN, slant=ITALIC)
+        receive_comment = cached_text("// Wait for response", font_size=18, color=GREEN, slant=ITALIC)
         receive_comment.next_to(code_lines[5], RIGHT, buff=0.5)
 
-        scene.play(LaggedStart(*[FadeIn(line, shift=RIGHT) for line in code_lines], lag_ratio=0.3))
+        scene.play(lagged_fade_in(code_lines, shift=RIGHT, lag_ratio=0.3))
         scene.wait(0.5)
         scene.play(FadeIn(send_comment, shift=LEFT))
         scene.play(FadeIn(receive_comment, shift=LEFT))
         scene.wait(2.5)
-        scene.play(FadeOut(code_title), FadeOut(code_lines), FadeOut(send_comment), FadeOut(receive_comment))
+        scene.play(FadeOut(Group(code_title, code_lines, send_comment, receive_comment)))
 
         # Section 5: Message Flow Animation (10s)
         # Client and Server
-        client = Text("Client", font_size=28)
+        client = cached_text("Client", font_size=28)
         client.move_to(LEFT * 5 + UP * 0.5)
 
-        server = Text("Server", font_size=28)
+        server = cached_text("Server", font_size=28)
         server.move_to(RIGHT * 5 + UP * 0.5)
 
         # Socket line
         socket_line = Line(LEFT * 4 + UP * 0.5, RIGHT * 4 + UP * 0.5, color=COLOR_CHANNEL, stroke_width=4)
 
         # Method labels
-        send_label = Text("channel.send(msg)", font_size=20, color=COLOR_ISOMSG)
+        send_label = cached_text("channel.send(msg)", font_size=20, color=COLOR_ISOMSG)
         send_label.next_to(client, DOWN, buff=0.5)
 
-        receive_label = Text("channel.receive()", font_size=20, color=COLOR_ISOMSG)
+        receive_label = cached_text("channel.receive()", font_size=20, color=COLOR_ISOMSG)
         receive_label.next_to(server, DOWN, buff=0.5)
 
         scene.play(Write(client), Write(server), Create(socket_line))
@@ -1486,7 +1744,7 @@ class JPOSScenes:
 
         # Message packet animation
         message_packet = Square(side_length=1.5, color=GREEN, fill_opacity=0.7)
-        msg_label = Text("ISOMsg", font_size=24, color=WHITE, weight=BOLD)
+        msg_label = cached_text("ISOMsg", font_size=24, color=WHITE, weight=BOLD)
         msg_label.move_to(message_packet.get_center())
         msg_group = VGroup(message_packet, msg_label)
         msg_group.move_to(socket_line.get_start())
@@ -1494,7 +1752,7 @@ class JPOSScenes:
         scene.play(msg_group.animate.move_to(socket_line.get_end()), run_time=2, rate_func=linear)
         scene.wait(1)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
     @staticmethod
     def construct_qmux(scene):
@@ -1504,48 +1762,40 @@ class JPOSScenes:
         # Helper function to create message box with details
         def create_message_box(label, mti, de41, de11, color=GREEN):
             box = Rectangle(width=1.5, height=1.2, color=color, fill_opacity=0.3, stroke_width=2)
-            msg_label = Text(label, font_size=18, weight=BOLD, color=WHITE)
-            mti_text = Text(f"MTI:{mti}", font_size=14, font="monospace")
-            key_text = Text(f"{de41}|{de11}", font_size=12, font="monospace", color=YELLOW)
+            msg_label = cached_text(label, font_size=18, weight=BOLD, color=WHITE)
+            mti_text = cached_text(f"MTI:{mti}", font_size=14, font="monospace")
+            key_text = cached_text(f"{de41}|{de11}", font_size=12, font="monospace", color=YELLOW)
 
+            # Shapes and Texts are built centered on the origin, and arrange()
+            # re-centers content, so the label stack already sits in the box
             content = VGroup(msg_label, mti_text, key_text).arrange(DOWN, buff=0.1)
-            content.move_to(box.get_center())
             return VGroup(box, content)
 
         # Helper function to create key tag
         def create_key_tag(key_str, color="#FF6B35"):
             tag = Rectangle(width=len(key_str)*0.12, height=0.3, color=color, fill_opacity=0.7, stroke_width=1)
-            tag_text = Text(key_str, font_size=12, color=WHITE)
-            tag_text.move_to(tag.get_center())
+            tag_text = cached_text(key_str, font_size=12, color=WHITE)
             return VGroup(tag, tag_text)
 
-        # Helper function to create thread indicator
-        def create_thread_indicator(name, state="active"):
-            colors = {"active": GREEN, "waiting": YELLOW, "done": GRAY}
-            circle = Circle(radius=0.25, color=colors.get(state, GREEN), fill_opacity=0.6, stroke_width=2)
-            label = Text(name, font_size=16, weight=BOLD)
-            label.move_to(circle.get_center())
-            return VGroup(circle, label)
-
         # Helper function to create queue visualization
         def create_queue_viz(title, num_slots=3, color=ORANGE):
             slots = VGroup(*[
                 Rectangle(width=1.8, height=0.8, color=color, stroke_width=2)
                 for _ in range(num_slots)
             ]).arrange(DOWN, buff=0.15)
-            queue_title = Text(title, font_size=20, color=color, weight=BOLD)
+            queue_title = cached_text(title, font_size=20, color=color, weight=BOLD)
             queue_title.next_to(slots, UP, buff=0.3)
             return VGroup(queue_title, slots)
 
         # =======================================================================
         # SECTION 1: The Problem (10-12s)
         # =======================================================================
-        section1_title = Text("The Problem: One Socket, Many Threads", font_size=40, weight=BOLD)
+        section1_title = cached_text("The Problem: One Socket, Many Threads", font_size=40, weight=BOLD)
         section1_title.to_edge(UP, buff=0.4)
         scene.play(Write(section1_title), run_time=0.6)
 
         # Emphasis on single socket constraint - bigger text
-        constraint_text = Text("Only ONE socket connection to processor", font_size=26, color=YELLOW, weight=BOLD)
+        constraint_text = cached_text("Only ONE socket connection to processor", font_size=26, color=YELLOW, weight=BOLD)
         constraint_text.next_to(section1_title, DOWN, buff=0.3)
         scene.play(FadeIn(constraint_text, shift=DOWN))
         scene.wait(0.5)
@@ -1555,87 +1805,84 @@ class JPOSScenes:
         divider.move_to(ORIGIN + DOWN * 0.35)
 
         # Left: Without MUX (Serial) - moved down
-        left_title = Text("Without Multiplexing", font_size=28, weight=BOLD, color=RED)
+        left_title = cached_text("Without Multiplexing", font_size=28, weight=BOLD, color=RED)
         left_title.move_to(LEFT * 3.5 + UP * 0.9)
-        left_subtitle = Text("Serial: One at a time", font_size=20, color=GRAY, slant=ITALIC)
+        left_subtitle = cached_text("Serial: One at a time", font_size=20, color=GRAY, slant=ITALIC)
         left_subtitle.next_to(left_title, DOWN, buff=0.2)
 
         # Right: With QMUX (Concurrent) - moved down
-        right_title = Text("With QMUX", font_size=28, weight=BOLD, color=GREEN)
+        right_title = cached_text("With QMUX", font_size=28, weight=BOLD, color=GREEN)
         right_title.move_to(RIGHT * 3.5 + UP * 0.8)
-        right_subtitle = Text("Concurrent: Share the socket", font_size=20, color=GRAY, slant=ITALIC)
+        right_subtitle = cached_text("Concurrent: Share the socket", font_size=20, color=GRAY, slant=ITALIC)
         right_subtitle.next_to(right_title, DOWN, buff=0.2)
 
         scene.play(Create(divider), Write(left_title), Write(right_title))
         scene.play(FadeIn(left_subtitle), FadeIn(right_subtitle))
 
-        DOWN_DELTA = 0.7
-
-        # LEFT SIDE: Show single socket with serial access - moved down
-        left_threads = VGroup(*[create_thread_indicator(f"T{i+1}") for i in range(3)])
-        left_threads.arrange(DOWN, buff=0.4).move_to(LEFT * 5.5 + DOWN * DOWN_DELTA)
-
-        # Single socket on left (emphasized) - moved down
-        left_socket = Rectangle(width=1.5, height=0.6, color=COLOR_CHANNEL, fill_opacity=0.4, stroke_width=3)
-        left_socket.move_to(LEFT * 3 + DOWN * DOWN_DELTA)
-        left_socket_label = Text("SINGLE\nSOCKET", font_size=14, color=COLOR_CHANNEL, weight=BOLD)
-        left_socket_label.move_to(left_socket.get_center())
-
-        # Payment processor on left - moved down and RIGHT to avoid overlap
-        left_processor = Circle(radius=0.5, color="#E6CCFF", fill_opacity=0.3, stroke_width=3)
-        left_processor.move_to(LEFT * 0.8 + DOWN * DOWN_DELTA)
-        left_proc_label = Text("Proc", font_size=14, color="#E6CCFF")
-        left_proc_label.move_to(left_processor.get_center())
+        # Both diagrams sit on one row below the subtitles
+        ROW = DOWN * 0.7
+
+        # Both sides share the same thread stack, socket and processor, placed
+        # at their own x positions on the diagram row
+        def create_socket_side(threads_x, socket_x, processor_x, socket_text):
+            threads = VGroup(*[thread_indicator(f"T{i+1}") for i in range(3)])
+            threads.arrange(DOWN, buff=0.4).move_to(RIGHT * threads_x + ROW)
+
+            socket = Rectangle(width=1.5, height=0.6, color=COLOR_CHANNEL, fill_opacity=0.4, stroke_width=3)
+            socket.move_to(RIGHT * socket_x + ROW)
+            socket_label = cached_text(socket_text, font_size=14, color=COLOR_CHANNEL, weight=BOLD)
+            socket_label.move_to(socket.get_center())
+
+            processor = Circle(radius=0.5, color=COLOR_PROCESSOR, fill_opacity=0.3, stroke_width=3)
+            processor.move_to(RIGHT * processor_x + ROW)
+            proc_label = cached_text("Proc", font_size=14, color=COLOR_PROCESSOR)
+            proc_label.move_to(processor.get_center())
+            return threads, socket, socket_label, processor, proc_label
+
+        # LEFT SIDE: single socket with serial access; the processor sits right
+        # of the socket, towards the divider
+        left_threads, left_socket, left_socket_label, left_processor, left_proc_label = create_socket_side(
+            -5.5, -3, -0.8, "SINGLE\nSOCKET"
+        )
 
         # Connection line
         left_line = Line(left_socket.get_right(), left_processor.get_left(), color=COLOR_CHANNEL, stroke_width=2)
 
-        scene.play(
-            LaggedStart(*[FadeIn(t) for t in left_threads], lag_ratio=0.2),
+        reveal(
+            scene,
+            lagged_fade_in(left_threads, lag_ratio=0.2),
             Create(left_socket), Write(left_socket_label),
             Create(left_line),
             Create(left_processor), Write(left_proc_label)
         )
 
         # Show T1 using socket, others blocked
-        for i, thread in enumerate(left_threads):
-            if i > 0:
-                thread[0].set_fill(YELLOW, opacity=0.3)  # waiting
+        VGroup(*[thread[0] for thread in left_threads[1:]]).set_fill(YELLOW, opacity=0.3)  # waiting
 
         # Add "BLOCKED" label
-        blocked_label = Text("Blocked!", font_size=18, color=RED, weight=BOLD)
+        blocked_label = cached_text("Blocked!", font_size=18, color=RED, weight=BOLD)
         blocked_label.next_to(left_threads[1], RIGHT, buff=0.3)
         scene.play(FadeIn(blocked_label))
         scene.wait(1)
 
-        # RIGHT SIDE: Show same single socket with QMUX multiplexing - moved down
-        right_threads = VGroup(*[create_thread_indicator(f"T{i+1}") for i in range(3)])
-        right_threads.arrange(DOWN, buff=0.4).move_to(RIGHT * 5.5 + DOWN * DOWN_DELTA)
+        # RIGHT SIDE: the same single socket behind QMUX, mirrored towards the divider
+        right_threads, right_socket, right_socket_label, right_processor, right_proc_label = create_socket_side(
+            5.5, 2.2, 0.6, "SAME\nSOCKET"
+        )
 
         # QMUX box - using ORANGE for better contrast instead of violet
         qmux_small = Rectangle(width=1.2, height=1.5, color=ORANGE, fill_opacity=0.4, stroke_width=3)
-        qmux_small.move_to(RIGHT * 4 + DOWN * DOWN_DELTA)
-        qmux_small_label = Text("QMUX", font_size=18, color=ORANGE, weight=BOLD)
+        qmux_small.move_to(RIGHT * 4 + ROW)
+        qmux_small_label = cached_text("QMUX", font_size=18, color=ORANGE, weight=BOLD)
         qmux_small_label.move_to(qmux_small.get_center())
 
-        # Single socket on right (same constraint!) - moved down
-        right_socket = Rectangle(width=1.5, height=0.6, color=COLOR_CHANNEL, fill_opacity=0.4, stroke_width=3)
-        right_socket.move_to(RIGHT * 2.2 + DOWN * DOWN_DELTA)
-        right_socket_label = Text("SAME\nSOCKET", font_size=14, color=COLOR_CHANNEL, weight=BOLD)
-        right_socket_label.move_to(right_socket.get_center())
-
-        # Payment processor on right - moved down and LEFT to avoid overlap
-        right_processor = Circle(radius=0.5, color="#E6CCFF", fill_opacity=0.3, stroke_width=3)
-        right_processor.move_to(RIGHT * 0.6 + DOWN * DOWN_DELTA)
-        right_proc_label = Text("Proc", font_size=14, color="#E6CCFF")
-        right_proc_label.move_to(right_processor.get_center())
-
         # Connection lines
         right_line1 = Line(qmux_small.get_left(), right_socket.get_right(), color=COLOR_CHANNEL, stroke_width=2)
         right_line2 = Line(right_socket.get_left(), right_processor.get_right(), color=COLOR_CHANNEL, stroke_width=2)
 
-        scene.play(
-            LaggedStart(*[FadeIn(t) for t in right_threads], lag_ratio=0.2),
+        reveal(
+            scene,
+            lagged_fade_in(right_threads, lag_ratio=0.2),
             Create(qmux_small), Write(qmux_small_label),
             Create(right_socket), Write(right_socket_label),
             Create(right_line1), Create(right_line2),
@@ -1643,83 +1890,89 @@ class JPOSScenes:
         )
 
         # All can send - QMUX manages the shared socket
-        for thread in right_threads:
-            thread[0].set_fill(GREEN, opacity=0.6)  # all active
+        VGroup(*[thread[0] for thread in right_threads]).set_fill(GREEN, opacity=0.6)  # all active
 
         # Add "All active!" label - moved DOWN below threads to avoid overlap with QMUX box
-        active_label = Text("All active!", font_size=18, color=GREEN, weight=BOLD)
+        active_label = cached_text("All active!", font_size=18, color=GREEN, weight=BOLD)
         active_label.move_to(RIGHT * 5.5 + DOWN * 2.2)
         scene.play(FadeIn(active_label))
 
         # Highlight the key insight - bigger text
-        insight = Text("QMUX multiplexes the single socket", font_size=24, color=YELLOW, slant=ITALIC)
+        insight = cached_text("QMUX multiplexes the single socket", font_size=24, color=YELLOW, slant=ITALIC)
         insight.to_edge(DOWN, buff=0.5)
         scene.play(FadeIn(insight, shift=UP))
         scene.wait(2)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
         # =======================================================================
         # SECTION 2: Three-Layer Architecture (12-15s)
         # =======================================================================
-        arch_title = Text("QMUX Architecture", font_size=36, weight=BOLD)
+        arch_title = cached_text("QMUX Architecture", font_size=36, weight=BOLD)
         arch_title.to_edge(UP, buff=0.4)
         scene.play(Write(arch_title), run_time=0.6)
         scene.wait(0.3)
         scene.play(arch_title.animate.scale(0.7).to_edge(UP, buff=0.2))
 
+        # Shared box styles: the three full-width layers, the queues, and the
+        # channel-side components
+        layer_style = dict(fill_opacity=0.2, stroke_width=3)
+        queue_style = dict(color=ORANGE, stroke_width=2, fill_opacity=0.1)
+        channel_style = dict(fill_opacity=0.3, stroke_width=2)
+
         # Application Layer (Yellow box)
-        app_box = Rectangle(width=10, height=1.3, color="#FFEB99", fill_opacity=0.2, stroke_width=3)
+        app_box = Rectangle(width=10, height=1.3, color=COLOR_APP_LAYER, **layer_style)
         app_box.move_to(UP * 2.4)
-        app_label = Text("APPLICATION LAYER", font_size=20, weight=BOLD, color="#FFEB99")
+        app_label = cached_text("APPLICATION LAYER", font_size=20, weight=BOLD, color=COLOR_APP_LAYER)
         app_label.move_to(app_box.get_top() + DOWN * 0.3)
 
         # Threads in app layer
-        app_threads = VGroup(*[create_thread_indicator(f"T{i+1}", "active") for i in range(3)])
+        app_threads = VGroup(*[thread_indicator(f"T{i+1}", "active") for i in range(3)])
         app_threads.arrange(RIGHT, buff=0.8).scale(0.7)
         app_threads.move_to(app_box.get_center() + DOWN * 0.15)
 
-        mux_request_label = Text("mux.request()", font_size=20, color=WHITE)
+        mux_request_label = cached_text("mux.request()", font_size=20, color=WHITE)
         mux_request_label.next_to(app_box, DOWN, buff=0.08)
 
         scene.play(Create(app_box), Write(app_label))
-        scene.play(LaggedStart(*[FadeIn(t) for t in app_threads], lag_ratio=0.2))
+        scene.play(lagged_fade_in(app_threads, lag_ratio=0.2))
         scene.play(FadeIn(mux_request_label, shift=DOWN))
         scene.wait(0.5)
 
         # jPOS Infrastructure Layer (Light blue box) - Slightly larger for better spacing
-        jpos_box = Rectangle(width=10, height=3.5, color="#CCE5FF", fill_opacity=0.2, stroke_width=3)
+        jpos_box = Rectangle(width=10, height=3.5, color=COLOR_JPOS_LAYER, **layer_style)
         jpos_box.move_to(DOWN * 0.5)
-        jpos_label = Text("jPOS INFRASTRUCTURE", font_size=20, weight=BOLD, color="#CCE5FF")
-        jpos_label.move_to(jpos_box.get_top() + DOWN * 0.3)
+        jpos_label = cached_text("jPOS INFRASTRUCTURE", font_size=20, weight=BOLD, color=COLOR_JPOS_LAYER)
+        jpos_top = jpos_box.get_top()
+        jpos_label.move_to(jpos_top + DOWN * 0.3)
 
         # QMUX component - ORANGE to match Section 1
         qmux_box = Rectangle(width=1.8, height=0.7, color=ORANGE, fill_opacity=0.4, stroke_width=3)
-        qmux_box.move_to(jpos_box.get_top() + DOWN * 0.95)
-        qmux_label = Text("QMUX", font_size=18, color=ORANGE, weight=BOLD)
+        qmux_box.move_to(jpos_top + DOWN * 0.95)
+        qmux_label = cached_text("QMUX", font_size=18, color=ORANGE, weight=BOLD)
         qmux_label.move_to(qmux_box.get_center())
 
         # Queues - ORANGE to match QMUX
-        out_queue = Rectangle(width=1.1, height=1.0, color=ORANGE, stroke_width=2, fill_opacity=0.1)
+        out_queue = Rectangle(width=1.1, height=1.0, **queue_style)
         out_queue.move_to(LEFT * 3.2 + DOWN * 0.25)
-        out_label = Text("Outgoing\nQueue", font_size=13, color=ORANGE)
+        out_label = cached_text("Outgoing\nQueue", font_size=13, color=ORANGE)
         out_label.move_to(out_queue.get_center())
 
-        in_queue = Rectangle(width=1.1, height=1.0, color=ORANGE, stroke_width=2, fill_opacity=0.1)
+        in_queue = Rectangle(width=1.1, height=1.0, **queue_style)
         in_queue.move_to(RIGHT * 3.2 + DOWN * 0.25)
-        in_label = Text("Incoming\nQueue", font_size=13, color=ORANGE)
+        in_label = cached_text("Incoming\nQueue", font_size=13, color=ORANGE)
         in_label.move_to(in_queue.get_center())
 
         # ChannelAdaptor - positioned WITHIN jPOS box with proper separation
-        adaptor_box = Rectangle(width=2.2, height=0.55, color=BLUE, fill_opacity=0.3, stroke_width=2)
+        adaptor_box = Rectangle(width=2.2, height=0.55, color=BLUE, **channel_style)
         adaptor_box.move_to(DOWN * 0.9)
-        adaptor_label = Text("ChannelAdaptor", font_size=13, color=BLUE)
+        adaptor_label = cached_text("ChannelAdaptor", font_size=13, color=BLUE)
         adaptor_label.move_to(adaptor_box.get_center())
 
         # Channel - positioned WITHIN jPOS box with clear separation from ChannelAdaptor
-        channel_box = Rectangle(width=2.2, height=0.55, color=COLOR_CHANNEL, fill_opacity=0.3, stroke_width=2)
+        channel_box = Rectangle(width=2.2, height=0.55, color=COLOR_CHANNEL, **channel_style)
         channel_box.move_to(jpos_box.get_bottom() + UP * 0.45)
-        channel_label = Text("Channel (TCP)", font_size=13, color=COLOR_CHANNEL)
+        channel_label = cached_text("Channel (TCP)", font_size=13, color=COLOR_CHANNEL)
         channel_label.move_to(channel_box.get_center())
 
         scene.play(Create(jpos_box), Write(jpos_label))
@@ -1733,31 +1986,31 @@ class JPOSScenes:
         scene.wait(1)
 
         # Payment Processor Layer (Light purple box)
-        proc_box = Rectangle(width=10, height=1.0, color="#E6CCFF", fill_opacity=0.2, stroke_width=3)
+        proc_box = Rectangle(width=10, height=1.0, color=COLOR_PROCESSOR, **layer_style)
         proc_box.to_edge(DOWN, buff=0.4)
-        proc_label = Text("PAYMENT PROCESSOR", font_size=20, weight=BOLD, color="#E6CCFF")
+        proc_label = cached_text("PAYMENT PROCESSOR", font_size=20, weight=BOLD, color=COLOR_PROCESSOR)
         proc_label.move_to(proc_box.get_center())
 
         scene.play(Create(proc_box), Write(proc_label))
         scene.wait(2)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
         # =======================================================================
         # SECTION 3: Key Concept (15-18s)
         # =======================================================================
-        key_title = Text("The Correlation Key", font_size=36, weight=BOLD)
+        key_title = cached_text("The Correlation Key", font_size=36, weight=BOLD)
         key_title.to_edge(UP, buff=0.5)
         scene.play(Write(key_title), run_time=0.6)
         scene.wait(0.3)
 
         # Example message
         msg_example = VGroup(
-            Text("MTI: 0200", font_size=24, color=COLOR_MTI),
-            Text("DE 2: 4111111111111111", font_size=20, color=GRAY),
-            Text("DE 4: 000000010000", font_size=20, color=GRAY),
-            Text("DE 11: 000001", font_size=24, color="#FF6B35", weight=BOLD),
-            Text("DE 41: 29110001", font_size=24, color="#FF6B35", weight=BOLD),
+            cached_text("MTI: 0200", font_size=24, color=COLOR_MTI),
+            cached_text("DE 2: 4111111111111111", font_size=20, color=GRAY),
+            cached_text("DE 4: 000000010000", font_size=20, color=GRAY),
+            cached_text("DE 11: 000001", font_size=24, color="#FF6B35", weight=BOLD),
+            cached_text("DE 41: 29110001", font_size=24, color="#FF6B35", weight=BOLD),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
         msg_example.move_to(LEFT * 3 + UP * 0.5)
 
@@ -1765,7 +2018,7 @@ class JPOSScenes:
         de11_box = SurroundingRectangle(msg_example[3], color="#FF6B35", buff=0.1)
         de41_box = SurroundingRectangle(msg_example[4], color="#FF6B35", buff=0.1)
 
-        scene.play(LaggedStart(*[FadeIn(line, shift=RIGHT) for line in msg_example], lag_ratio=0.2))
+        scene.play(lagged_fade_in(msg_example, shift=RIGHT, lag_ratio=0.2))
         scene.play(Create(de11_box), Create(de41_box))
         scene.wait(0.5)
 
@@ -1775,7 +2028,7 @@ class JPOSScenes:
         # Larger box to contain the full key text
         key_box = Rectangle(width=4.8, height=1, color=YELLOW, fill_opacity=0.3, stroke_width=3)
         key_box.move_to(RIGHT * 3.6 + UP * 0.2)
-        key_label = Text('Key = "29110001|000001"', font_size=20, color=YELLOW, weight=BOLD, font="monospace")
+        key_label = cached_text('Key = "29110001|000001"', font_size=20, color=YELLOW, weight=BOLD, font="monospace")
         key_label.move_to(key_box.get_center())
 
         scene.play(Create(arrow))
@@ -1784,50 +2037,51 @@ class JPOSScenes:
 
         # Show XML config
         xml_config = VGroup(
-            Text("<key>41,11</key>", font_size=22, color=COLOR_XML, font="monospace"),
-            Text("← Configurable!", font_size=18, color=GRAY, slant=ITALIC),
+            cached_text("<key>41,11</key>", font_size=22, color=COLOR_XML, font="monospace"),
+            cached_text("← Configurable!", font_size=18, color=GRAY, slant=ITALIC),
         ).arrange(RIGHT, buff=0.3)
         xml_config.move_to(DOWN * 1.5)
 
         scene.play(FadeIn(xml_config, shift=UP))
         scene.wait(2)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
         # =======================================================================
         # SECTION 4: Request Flow (25-30s)
         # =======================================================================
-        flow_title = Text("Request Flow: 3 Concurrent Requests", font_size=32, weight=BOLD)
+        flow_title = cached_text("Request Flow: 3 Concurrent Requests", font_size=32, weight=BOLD)
         flow_title.to_edge(UP, buff=0.3)
         scene.play(Write(flow_title), run_time=0.6)
         scene.wait(0.3)
         scene.play(flow_title.animate.scale(0.8).to_edge(UP, buff=0.1))
 
         # Simplified architecture for flow - all aligned vertically with bigger text
-        threads_area = VGroup(*[create_thread_indicator(f"T{i+1}", "active") for i in range(3)])
-        threads_area.arrange(DOWN, buff=0.7).scale(0.9)
-        threads_area.move_to(LEFT * 5.5)
+        threads_area = thread_column("active").move_to(LEFT * 5.5)
 
         qmux_comp = Rectangle(width=1.8, height=2.8, color=ORANGE, fill_opacity=0.2, stroke_width=3)
         qmux_comp.move_to(LEFT * 3)
-        qmux_lbl = Text("QMUX", font_size=22, color=ORANGE, weight=BOLD)
+        qmux_lbl = cached_text("QMUX", font_size=22, color=ORANGE, weight=BOLD)
         qmux_lbl.move_to(qmux_comp.get_top() + DOWN * 0.4)
 
         outq_viz = create_queue_viz("Outgoing", num_slots=3)
         outq_viz.move_to(ORIGIN)
+        # Where each queued message (slot center) and its key (right of the slot) land
+        slot_centers = np.array([slot.get_center() for slot in outq_viz[1]])
+        key_targets = np.array([slot.get_right() for slot in outq_viz[1]]) + RIGHT * 0.3
 
         channel_viz = Rectangle(width=2.2, height=0.7, color=COLOR_CHANNEL, fill_opacity=0.3, stroke_width=3)
         channel_viz.move_to(RIGHT * 3)
-        ch_lbl = Text("Channel", font_size=18, color=COLOR_CHANNEL, weight=BOLD)
+        ch_lbl = cached_text("Channel", font_size=18, color=COLOR_CHANNEL, weight=BOLD)
         ch_lbl.move_to(channel_viz.get_center())
 
-        processor_circle = Circle(radius=0.9, color="#E6CCFF", fill_opacity=0.3, stroke_width=3)
+        processor_circle = Circle(radius=0.9, color=COLOR_PROCESSOR, fill_opacity=0.3, stroke_width=3)
         processor_circle.move_to(RIGHT * 5.5)
-        proc_lbl = Text("Processor", font_size=18, color="#E6CCFF", weight=BOLD)
+        proc_lbl = cached_text("Processor", font_size=18, color=COLOR_PROCESSOR, weight=BOLD)
         proc_lbl.move_to(processor_circle.get_center())
 
         scene.play(
-            LaggedStart(*[FadeIn(t) for t in threads_area], lag_ratio=0.15),
+            lagged_fade_in(threads_area, lag_ratio=0.15),
             Create(qmux_comp), Write(qmux_lbl),
             FadeIn(outq_viz),
             Create(channel_viz), Write(ch_lbl),
@@ -1848,26 +2102,27 @@ class JPOSScenes:
             key.scale(0.6)
             keys.append(key)
 
-        # Animate request flow
-        for i, (msg, key, thread) in enumerate(zip(messages, keys, threads_area)):
-            # Message appears
-            scene.play(FadeIn(msg, shift=RIGHT), run_time=0.4)
-
-            # Key extracted
+        # Animate request flow, one request at a time
+        for msg, key, thread, slot_center, key_target in zip(messages, keys, threads_area, slot_centers, key_targets):
+            # Message appears, then its key is extracted; both are introducers,
+            # so one sequential group plays them back to back
             key.move_to(msg.get_top() + UP * 0.2)
-            scene.play(FadeIn(key, scale=0.5), run_time=0.3)
+            scene.play(AnimationGroup(
+                FadeIn(msg, shift=RIGHT, run_time=0.4),
+                FadeIn(key, scale=0.5, run_time=0.3),
+                lag_ratio=1,
+            ))
 
             # Thread goes to waiting
             thread[0].set_fill(YELLOW, opacity=0.6)
-            wait_icon = Text("⏱", font_size=14)
+            wait_icon = cached_text("⏱", font_size=14)
             wait_icon.next_to(thread, RIGHT, buff=0.1)
             scene.play(FadeIn(wait_icon), run_time=0.2)
 
             # Message to outgoing queue
-            target_slot = outq_viz[1][i]
             scene.play(
-                msg.animate.scale(0.8).move_to(target_slot.get_center()),
-                key.animate.move_to(target_slot.get_right() + RIGHT * 0.3),
+                msg.animate.scale(0.8).move_to(slot_center),
+                key.animate.move_to(key_target),
                 run_time=0.6
             )
             scene.wait(0.3)
@@ -1875,60 +2130,60 @@ class JPOSScenes:
         scene.wait(1)
 
         # ChannelAdaptor sends them
+        channel_center = channel_viz.get_center()
+        processor_center = processor_circle.get_center()
         for i, msg in enumerate(messages):
             scene.play(
-                msg.animate.move_to(channel_viz.get_center()),
+                msg.animate.move_to(channel_center),
                 keys[i].animate.fade(0.7),
                 run_time=0.5
             )
             scene.play(
-                msg.animate.scale(0.6).move_to(processor_circle.get_center()),
+                msg.animate.scale(0.6).move_to(processor_center),
                 run_time=0.7
             )
             scene.wait(0.2)
 
         scene.wait(1)
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
         # =======================================================================
         # SECTION 5: Out-of-Order Response Matching (30-35s)
         # =======================================================================
-        match_title = Text("Response Matching: Out of Order!", font_size=32, weight=BOLD, color=YELLOW)
+        match_title = cached_text("Response Matching: Out of Order!", font_size=32, weight=BOLD, color=YELLOW)
         match_title.to_edge(UP, buff=0.3)
         scene.play(Write(match_title), run_time=0.6)
         scene.wait(0.3)
         scene.play(match_title.animate.scale(0.8).to_edge(UP, buff=0.1))
 
         # Recreate simplified layout - matching Section 4 alignment and sizes
-        threads_waiting = VGroup(*[create_thread_indicator(f"T{i+1}", "waiting") for i in range(3)])
-        threads_waiting.arrange(DOWN, buff=0.7).scale(0.9)
-        threads_waiting.move_to(LEFT * 5.5)
+        threads_waiting = thread_column("waiting").move_to(LEFT * 5.5)
 
         # Show what they're waiting for - bigger labels
         wait_labels = VGroup(
-            Text("K1", font_size=18, color=YELLOW, weight=BOLD),
-            Text("K2", font_size=18, color=YELLOW, weight=BOLD),
-            Text("K3", font_size=18, color=YELLOW, weight=BOLD),
+            cached_text("K1", font_size=18, color=YELLOW, weight=BOLD),
+            cached_text("K2", font_size=18, color=YELLOW, weight=BOLD),
+            cached_text("K3", font_size=18, color=YELLOW, weight=BOLD),
         )
         for i, (thread, label) in enumerate(zip(threads_waiting, wait_labels)):
             label.next_to(thread, RIGHT, buff=0.3)
 
         qmux_matcher = Rectangle(width=2.2, height=3.2, color=ORANGE, fill_opacity=0.2, stroke_width=3)
         qmux_matcher.move_to(LEFT * 2.2)
-        qmux_match_lbl = Text("QMUX\nMatcher", font_size=22, color=ORANGE, weight=BOLD)
+        qmux_match_lbl = cached_text("QMUX\nMatcher", font_size=22, color=ORANGE, weight=BOLD)
         qmux_match_lbl.move_to(qmux_matcher.get_center())
 
         inq_viz = create_queue_viz("Incoming", num_slots=3, color=ORANGE)
         inq_viz.move_to(RIGHT * 1.8)
 
-        proc_resp = Circle(radius=0.9, color="#E6CCFF", fill_opacity=0.3, stroke_width=3)
+        proc_resp = Circle(radius=0.9, color=COLOR_PROCESSOR, fill_opacity=0.3, stroke_width=3)
         proc_resp.move_to(RIGHT * 5.5)
-        proc_resp_lbl = Text("Processor", font_size=18, color="#E6CCFF", weight=BOLD)
+        proc_resp_lbl = cached_text("Processor", font_size=18, color=COLOR_PROCESSOR, weight=BOLD)
         proc_resp_lbl.move_to(proc_resp.get_center())
 
         scene.play(
-            LaggedStart(*[FadeIn(t) for t in threads_waiting], lag_ratio=0.15),
-            *[FadeIn(l) for l in wait_labels],
+            lagged_fade_in(threads_waiting, lag_ratio=0.15),
+            FadeIn(wait_labels),
             Create(qmux_matcher), Write(qmux_match_lbl),
             FadeIn(inq_viz),
             Create(proc_resp), Write(proc_resp_lbl)
@@ -1942,6 +2197,24 @@ class JPOSScenes:
             (1, "R2", "0210", "K2:000002", BLUE),  # R2 third
         ]
 
+        # One flash rect, redrawn around the matcher for every response; FadeOut
+        # resets it to full opacity when it leaves the scene
+        flash_box = SurroundingRectangle(qmux_matcher, color=YELLOW, buff=0.05)
+
+        # The matcher's verdict for each response, built up front and placed under it
+        match_text_pos = qmux_matcher.get_bottom() + DOWN * 0.4
+        match_texts = {
+            thread_idx: cached_text(f"Match: {key_str} → T{thread_idx+1}", font_size=18, color=GREEN, weight=BOLD)
+            .move_to(match_text_pos)
+            for thread_idx, _, _, key_str, _ in response_order
+        }
+
+        # One check mark per thread, shown when its response is delivered
+        check_marks = [
+            cached_text("✓", font_size=24, color=GREEN, weight=BOLD).move_to(thread.get_right() + RIGHT * 0.3)
+            for thread in threads_waiting
+        ]
+
         for thread_idx, resp_label, mti, key_str, color in response_order:
             # Response comes from processor
             resp_msg = create_message_box(resp_label, mti, "29110001", key_str.split(':')[1], color)
@@ -1962,13 +2235,11 @@ class JPOSScenes:
             scene.wait(0.3)
 
             # QMUX extracts key and matches
-            flash_box = SurroundingRectangle(qmux_matcher, color=YELLOW, buff=0.05)
             scene.play(Create(flash_box), run_time=0.2)
             scene.play(FadeOut(flash_box), run_time=0.2)
 
             # Show matching logic - bigger text
-            match_text = Text(f"Match: {key_str} → T{thread_idx+1}", font_size=18, color=GREEN, weight=BOLD)
-            match_text.move_to(qmux_matcher.get_bottom() + DOWN * 0.4)
+            match_text = match_texts[thread_idx]
             scene.play(FadeIn(match_text, shift=UP), run_time=0.4)
 
             # Deliver to correct thread
@@ -1981,8 +2252,7 @@ class JPOSScenes:
 
             # Thread completes
             target_thread[0].set_fill(GREEN, opacity=0.8)
-            check_mark = Text("✓", font_size=24, color=GREEN, weight=BOLD)
-            check_mark.move_to(target_thread.get_right() + RIGHT * 0.3)
+            check_mark = check_marks[thread_idx]
             scene.play(
                 FadeIn(check_mark, scale=2),
                 FadeOut(wait_labels[thread_idx]),
@@ -1992,146 +2262,128 @@ class JPOSScenes:
             scene.wait(0.5)
 
         scene.wait(2)
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
         # =======================================================================
         # SECTION 6: Edge Cases (15-20s)
         # =======================================================================
-        edge_title = Text("Edge Cases", font_size=36, weight=BOLD)
+        edge_title = cached_text("Edge Cases", font_size=36, weight=BOLD)
         edge_title.to_edge(UP, buff=0.4)
         scene.play(Write(edge_title), run_time=0.6)
         scene.wait(0.2)
 
         # Split screen for two cases
+        LEFT_COL = LEFT * 3.5
+        RIGHT_COL = RIGHT * 3.5
         divider2 = Line(UP * 3, DOWN * 3, color=GRAY)
-        scene.play(Create(divider2))
+        reveal(scene, Create(divider2))
 
         # LEFT: Timeout - 50% bigger
-        timeout_label = Text("Case 1: Timeout", font_size=32, weight=BOLD, color=RED)
-        timeout_label.move_to(LEFT * 3.5 + UP * 2.6)
+        timeout_label = cached_text("Case 1: Timeout", font_size=32, weight=BOLD, color=RED)
+        timeout_label.move_to(LEFT_COL + UP * 2.6)
         scene.play(Write(timeout_label))
 
-        t4 = create_thread_indicator("T4", "waiting")
-        t4.scale(1.5).move_to(LEFT * 3.5 + UP * 0.4)
+        t4 = thread_indicator("T4", "waiting")
+        t4.scale(1.5).move_to(LEFT_COL + UP * 0.4)
         m4 = create_message_box("M4", "0200", "29110001", "000004", GREEN)
-        m4.scale(0.9).move_to(LEFT * 3.5 + UP * 0.1)
+        m4.scale(0.9).move_to(LEFT_COL + UP * 0.1)
 
-        clock = Text("⏰", font_size=60)
-        clock.move_to(LEFT * 3.5 + DOWN * 0.7)
-        timer_text = Text("30s...", font_size=30, color=YELLOW, weight=BOLD)
+        clock = cached_text("⏰", font_size=60)
+        clock.move_to(LEFT_COL + DOWN * 0.7)
+        timer_text = cached_text("30s...", font_size=30, color=YELLOW, weight=BOLD)
         timer_text.next_to(clock, DOWN, buff=0.2)
 
         scene.play(FadeIn(t4), FadeIn(m4))
         scene.play(FadeIn(clock), Write(timer_text))
 
         # Count down - bigger font
-        for t in [20, 10, 5, 0]:
-            new_timer = Text(f"{t}s...", font_size=30, color=YELLOW if t > 0 else RED, weight=BOLD)
-            new_timer.move_to(timer_text.get_center())
+        timer_center = timer_text.get_center()
+        countdown = {
+            t: cached_text(f"{t}s...", font_size=30, color=YELLOW if t > 0 else RED, weight=BOLD).move_to(timer_center)
+            for t in [20, 10, 5, 0]
+        }
+        for new_timer in countdown.values():
             scene.play(Transform(timer_text, new_timer), run_time=0.4)
 
         # Returns null - bigger
-        null_text = Text("returns null", font_size=30, color=RED, slant=ITALIC, weight=BOLD)
-        null_text.move_to(LEFT * 3.5 + DOWN * 1.8)
+        null_text = cached_text("returns null", font_size=30, color=RED, slant=ITALIC, weight=BOLD)
+        null_text.move_to(LEFT_COL + DOWN * 1.8)
         scene.play(FadeIn(null_text, shift=UP))
 
-        code_snippet = VGroup(
-            Text("if (response == null) {", font_size=16, font="monospace"),
-            Text("  // Timeout!", font_size=16, font="monospace", color=RED),
-            Text("  // Retry or reverse", font_size=16, font="monospace", color=GRAY),
-            Text("}", font_size=16, font="monospace"),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.1)
-        code_snippet.move_to(LEFT * 3.5 + DOWN * 2.7)
+        code_snippet = text_lines(
+            "if (response == null) {",
+            "  // Timeout!",
+            "  // Retry or reverse",
+            "}",
+            font_size=16, font="monospace", buff=0.1,
+        )
+        for line, color in zip(code_snippet, [WHITE, RED, GRAY, WHITE]):
+            line.set_color(color)
+        code_snippet.move_to(LEFT_COL + DOWN * 2.7)
         scene.play(FadeIn(code_snippet, shift=UP), run_time=0.6)
 
         # RIGHT: Unmatched response - 50% bigger
-        unmatched_label = Text("Case 2: Unmatched", font_size=32, weight=BOLD, color=ORANGE)
-        unmatched_label.move_to(RIGHT * 3.5 + UP * 2.2)
+        unmatched_label = cached_text("Case 2: Unmatched", font_size=32, weight=BOLD, color=ORANGE)
+        unmatched_label.move_to(RIGHT_COL + UP * 2.2)
         scene.play(Write(unmatched_label))
 
         orphan_resp = create_message_box("R99", "0210", "29110001", "000099", BLUE)
-        orphan_resp.scale(0.9).move_to(RIGHT * 3.5 + UP * 0.8)
+        orphan_resp.scale(0.9).move_to(RIGHT_COL + UP * 0.8)
         orphan_key = create_key_tag("K99:000099")
         orphan_key.scale(1.1).move_to(orphan_resp.get_top() + UP * 0.25)
 
         scene.play(FadeIn(orphan_resp), FadeIn(orphan_key))
 
-        question = Text("No matching request!", font_size=27, color=ORANGE, slant=ITALIC, weight=BOLD)
-        question.move_to(RIGHT * 3.5 + DOWN * 0.3)
+        question = cached_text("No matching request!", font_size=27, color=ORANGE, slant=ITALIC, weight=BOLD)
+        question.move_to(RIGHT_COL + DOWN * 0.3)
         scene.play(FadeIn(question, shift=UP))
         scene.wait(0.5)
 
         # Arrow pointing down - thicker
-        down_arrow = Arrow(RIGHT * 3.5 + DOWN * 0.65, RIGHT * 3.5 + DOWN * 1.0, color=ORANGE, stroke_width=6)
-        scene.play(Create(down_arrow))
+        down_arrow = Arrow(RIGHT_COL + DOWN * 0.65, RIGHT_COL + DOWN * 1.0, color=ORANGE, stroke_width=6)
+        reveal(scene, Create(down_arrow))
 
         unhandled_box = Rectangle(width=3.75, height=0.9, color=ORANGE, fill_opacity=0.3, stroke_width=3)
-        unhandled_box.move_to(RIGHT * 3.5 + DOWN * 1.5)
-        unhandled_lbl = Text("Unhandled Queue", font_size=21, color=ORANGE, weight=BOLD)
+        unhandled_box.move_to(RIGHT_COL + DOWN * 1.5)
+        unhandled_lbl = cached_text("Unhandled Queue", font_size=21, color=ORANGE, weight=BOLD)
         unhandled_lbl.move_to(unhandled_box.get_center())
 
-        scene.play(Create(unhandled_box), Write(unhandled_lbl))
+        reveal(scene, Create(unhandled_box), Write(unhandled_lbl))
 
-        or_text = Text("or", font_size=21, color=GRAY, slant=ITALIC)
-        or_text.move_to(RIGHT * 3.5 + DOWN * 2.15)
+        or_text = cached_text("or", font_size=21, color=GRAY, slant=ITALIC)
+        or_text.move_to(RIGHT_COL + DOWN * 2.15)
         scene.play(FadeIn(or_text))
 
-        listener_box = Rectangle(width=4.2, height=0.9, color=ORANGE, fill_opacity=0.3, stroke_width=3)
-        listener_box.move_to(RIGHT * 3.5 + DOWN * 2.8)
-        listener_lbl = Text("ISORequestListener", font_size=21, color=ORANGE, font="monospace", weight=BOLD)
+        # Same style as the unhandled box, only wider
+        listener_box = unhandled_box.copy().stretch_to_fit_width(4.2)
+        listener_box.move_to(RIGHT_COL + DOWN * 2.8)
+        listener_lbl = cached_text("ISORequestListener", font_size=21, color=ORANGE, font="monospace", weight=BOLD)
         listener_lbl.move_to(listener_box.get_center())
-        scene.play(Create(listener_box), Write(listener_lbl))
+        reveal(scene, Create(listener_box), Write(listener_lbl))
 
         scene.wait(2.5)
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
         # =======================================================================
         # SECTION 6.5: ChannelAdaptor Configuration (12-15s)
         # =======================================================================
-        channel_config_title = Text("ChannelAdaptor Configuration", font_size=36, weight=BOLD)
+        channel_config_title = cached_text("ChannelAdaptor Configuration", font_size=36, weight=BOLD)
         channel_config_title.to_edge(UP, buff=0.3)
         scene.play(Write(channel_config_title), run_time=0.6)
         scene.wait(0.2)
         scene.play(channel_config_title.animate.scale(0.75).to_edge(UP, buff=0.15))
 
         # Create ChannelAdaptor XML configuration
-        channel_code_str = """<channel-adaptor name="my-channel">
-  <channel class="...NACChannel"
-           packager="...GenericPackager">
-    <property name="host" value="localhost" />
-    <property name="port" value="8000" />
-    <property name="timeout" value="300000" />
-  </channel>
-  <in>send</in>
-  <out>receive</out>
-  <reconnect-delay>10000</reconnect-delay>
-</channel-adaptor>"""
-
-        # Create the Code mobject
-        channel_code_block = Code(
-            code_string=channel_code_str,
-            language="xml",
-            formatter_style="native",
-            add_line_numbers=False,
-            background="rectangle",
-            paragraph_config={
-                "font": "monospace",
-                "font_size": 24,
-                "line_spacing": 1
-            }
-        )
-
-        # Extract the Paragraph (text lines) from the Code mobject
-        channel_xml_lines = channel_code_block[1]
-
-        # Set colors for specific lines
-        channel_xml_lines[1].set_color(BLUE)  # Channel type
-        channel_xml_lines[3].set_color(COLOR_CHANNEL)  # host
-        channel_xml_lines[4].set_color(COLOR_CHANNEL)  # port
-        channel_xml_lines[5].set_color(COLOR_CHANNEL)  # timeout
-        channel_xml_lines[7].set_color(ORANGE)  # in (outgoing)
-        channel_xml_lines[8].set_color(ORANGE)  # out (incoming)
-        channel_xml_lines[9].set_color(GREEN)  # reconnect-delay
+        # Syntax-highlighted ChannelAdaptor XML configuration
+        channel_xml_lines = xml_code(CHANNEL_ADAPTOR_XML, {
+            1: BLUE,  # Channel type
+            3: COLOR_CHANNEL,  # host
+            4: COLOR_CHANNEL,  # port
+            5: COLOR_CHANNEL,  # timeout
+            7: ORANGE,  # in (outgoing)
+            8: ORANGE,  # out (incoming)
+            9: GREEN,  # reconnect-delay
+        })
 
         # Position the text block
         channel_xml_lines.move_to(LEFT * 2.5 + DOWN * 0.2)
@@ -2141,15 +2393,17 @@ class JPOSScenes:
         CHANNEL_ANNOTATION_COLOR = WHITE
 
         # Create annotations for ChannelAdaptor
-        channel_annotations = VGroup(
-            Text("← Channel type", font_size=CHANNEL_ANNOTATION_FONT_SIZE, color=CHANNEL_ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Server address", font_size=CHANNEL_ANNOTATION_FONT_SIZE, color=CHANNEL_ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Server port", font_size=CHANNEL_ANNOTATION_FONT_SIZE, color=CHANNEL_ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Socket timeout", font_size=CHANNEL_ANNOTATION_FONT_SIZE, color=CHANNEL_ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Outgoing queue", font_size=CHANNEL_ANNOTATION_FONT_SIZE, color=CHANNEL_ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Incoming queue", font_size=CHANNEL_ANNOTATION_FONT_SIZE, color=CHANNEL_ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Reconnect delay", font_size=CHANNEL_ANNOTATION_FONT_SIZE, color=CHANNEL_ANNOTATION_COLOR, slant=ITALIC),
-        )
+        channel_annotations = text_lines(
+            "← Channel type",
+            "← Server address",
+            "← Server port",
+            "← Socket timeout",
+            "← Outgoing queue",
+            "← Incoming queue",
+            "← Reconnect delay",
+            font_size=CHANNEL_ANNOTATION_FONT_SIZE,
+            slant=ITALIC,
+        ).set_color(CHANNEL_ANNOTATION_COLOR)
 
         CHANNEL_ANNOTATION_BUFFER = 1.5
 
@@ -2168,9 +2422,7 @@ class JPOSScenes:
             channel_xml_lines[9],  # reconnect-delay
         ]
 
-        for ann, code_line in zip(channel_annotations, channel_code_lines):
-            ann.set_x(channel_annotation_column_x, direction=LEFT)
-            ann.match_y(code_line)
+        align_labels_to_lines(channel_annotations, channel_code_lines, channel_annotation_column_x)
 
         # Animation
         scene.play(
@@ -2178,55 +2430,23 @@ class JPOSScenes:
             run_time=3
         )
         scene.wait(0.5)
-        scene.play(LaggedStart(*[FadeIn(ann, shift=LEFT) for ann in channel_annotations], lag_ratio=0.15), run_time=2)
+        scene.play(lagged_fade_in(channel_annotations, shift=LEFT, lag_ratio=0.15), run_time=2)
         scene.wait(2)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
         # =======================================================================
         # SECTION 7: QMUX Configuration (12-15s)
         # =======================================================================
-        xml_title = Text("QMUX Configuration", font_size=36, weight=BOLD)
+        xml_title = cached_text("QMUX Configuration", font_size=36, weight=BOLD)
         xml_title.to_edge(UP, buff=0.3)
         scene.play(Write(xml_title), run_time=0.6)
         scene.wait(0.2)
         scene.play(xml_title.animate.scale(0.75).to_edge(UP, buff=0.15))
 
-        # Create a single triple-quoted string
-        code_str = """<mux class="...QMUX" name="mymux">
-  <key>41,11</key>
-  <in>receive</in>
-  <out>send</out>
-  <ready>...channel-ready</ready>
-  <unhandled>orphans</unhandled>
-  <request-listener .../>
-</mux>"""  # <-- Note: The </mux> is NOT indented here in the string.
-
-        # 1. Create the Code mobject TEMPORARILY
-        code_block = Code(
-            code_string=code_str,
-            language="xml",
-            formatter_style="native",
-            add_line_numbers=False,
-            background="rectangle",
-            paragraph_config={
-                "font": "monospace",
-                "font_size": 24,
-                "line_spacing": 1
-            }
-        )
-
-        # Extract ONLY the text (the Paragraph mobject)
-        xml_lines = code_block[1]
-
-        xml_lines[0].set_color(COLOR_XML)
-        xml_lines[1].set_color(YELLOW)
-        xml_lines[2].set_color(COLOR_CHANNEL)
-        xml_lines[3].set_color(COLOR_CHANNEL)
-        xml_lines[4].set_color(GREEN)
-        xml_lines[5].set_color(ORANGE)
-        xml_lines[6].set_color(GRAY)
-        xml_lines[7].set_color(COLOR_XML)
+        # Syntax-highlighted QMUX XML configuration
+        qmux_colors = [COLOR_XML, YELLOW, COLOR_CHANNEL, COLOR_CHANNEL, GREEN, ORANGE, GRAY, COLOR_XML]
+        xml_lines = xml_code(QMUX_XML, dict(enumerate(qmux_colors)))
 
         # Move the text block
         xml_lines.move_to(LEFT * 3.5 + DOWN * 0.2)
@@ -2237,14 +2457,16 @@ class JPOSScenes:
         ANNOTATION_FONT_SIZE = 24  # Increased font size
         ANNOTATION_COLOR = WHITE  # Changed from GRAY to WHITE for better visibility
 
-        annotations = VGroup(
-            Text("← Correlation fields", font_size=ANNOTATION_FONT_SIZE, color=ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Incoming queue", font_size=ANNOTATION_FONT_SIZE, color=ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Outgoing queue", font_size=ANNOTATION_FONT_SIZE, color=ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Channel ready flag", font_size=ANNOTATION_FONT_SIZE, color=ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Unmatched messages", font_size=ANNOTATION_FONT_SIZE, color=ANNOTATION_COLOR, slant=ITALIC),
-            Text("← Optional handler", font_size=ANNOTATION_FONT_SIZE, color=ANNOTATION_COLOR, slant=ITALIC),
-        )
+        annotations = text_lines(
+            "← Correlation fields",
+            "← Incoming queue",
+            "← Outgoing queue",
+            "← Channel ready flag",
+            "← Unmatched messages",
+            "← Optional handler",
+            font_size=ANNOTATION_FONT_SIZE,
+            slant=ITALIC,
+        ).set_color(ANNOTATION_COLOR)
 
         ANNOTATION_BUFFER = 1.5
 
@@ -2254,9 +2476,7 @@ class JPOSScenes:
         code_right_x = xml_lines.get_right()[0]
         annotation_column_x = code_right_x + ANNOTATION_BUFFER
 
-        for ann, code_line in zip(annotations, xml_lines[1:7]):
-            ann.set_x(annotation_column_x, direction=LEFT)
-            ann.match_y(code_line)
+        align_labels_to_lines(annotations, xml_lines[1:7], annotation_column_x)
 
         # --- END FIX ---
 
@@ -2273,55 +2493,56 @@ class JPOSScenes:
         )
         scene.wait(2)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
 
         # =======================================================================
         # SECTION 8: Summary (10-12s)
         # =======================================================================
-        summary_title = Text("QMUX Benefits", font_size=40, weight=BOLD)
+        summary_title = cached_text("QMUX Benefits", font_size=40, weight=BOLD)
         summary_title.to_edge(UP, buff=0.5)
         scene.play(Write(summary_title), run_time=0.6)
         scene.wait(0.3)
 
-        benefits = VGroup(
-            Text("✓ Multiple concurrent requests on single channel", font_size=24, color=GREEN),
-            Text("✓ Automatic response correlation by key", font_size=24, color=GREEN),
-            Text("✓ Out-of-order handling", font_size=24, color=GREEN),
-            Text("✓ Timeout protection", font_size=24, color=GREEN),
-            Text("✓ Configurable correlation fields", font_size=24, color=GREEN),
-            Text("✓ Production-grade reliability", font_size=24, color=GREEN),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+        benefits = text_lines(
+            "✓ Multiple concurrent requests on single channel",
+            "✓ Automatic response correlation by key",
+            "✓ Out-of-order handling",
+            "✓ Timeout protection",
+            "✓ Configurable correlation fields",
+            "✓ Production-grade reliability",
+            font_size=24, buff=0.4,
+        ).set_color(GREEN)
         benefits.move_to(DOWN * 0.3)
 
-        scene.play(LaggedStart(*[FadeIn(benefit, shift=RIGHT) for benefit in benefits], lag_ratio=0.3), run_time=3)
+        scene.play(lagged_fade_in(benefits, shift=RIGHT, lag_ratio=0.3), run_time=3)
         scene.wait(2.5)
 
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
     @staticmethod
     def construct_jpos_credits(scene):
         """jPOS Credits and Attribution (10-12s)."""
 
         # Title - jPOS (compact header)
-        title = Text("jPOS", font_size=50, weight=BOLD, color="#BE0811")
+        title = cached_text("jPOS", font_size=50, weight=BOLD, color="#BE0811")
         title.to_edge(UP, buff=0.5)
         scene.play(Write(title), run_time=0.8)
         scene.wait(0.3)
 
         # Website
-        website = Text("https://jpos.org/", font_size=24, color=BLUE)
+        website = cached_text("https://jpos.org/", font_size=24, color=BLUE)
         website.next_to(title, DOWN, buff=0.2)
         scene.play(FadeIn(website, shift=UP), run_time=0.6)
         scene.wait(0.5)
 
         # Special thanks section (better positioned)
-        thanks_title = Text("Special Thanks", font_size=30, weight=BOLD)
+        thanks_title = cached_text("Special Thanks", font_size=30, weight=BOLD)
         thanks_title.move_to(UP * 1.9)
 
         thanks_text = VGroup(
-            Text("Alejandro Revilla", font_size=24, color=YELLOW),
-            Text("Creator of jPOS", font_size=20, color=GRAY, slant=ITALIC)
+            cached_text("Alejandro Revilla", font_size=24, color=YELLOW),
+            cached_text("Creator of jPOS", font_size=20, color=GRAY, slant=ITALIC)
         ).arrange(DOWN, buff=0.15)
         thanks_text.next_to(thanks_title, DOWN, buff=0.3)
 
@@ -2330,12 +2551,12 @@ class JPOSScenes:
         scene.wait(0.8)
 
         # Created by section (with more spacing)
-        created_title = Text("Presentation Created By", font_size=26, weight=BOLD)
+        created_title = cached_text("Presentation Created By", font_size=26, weight=BOLD)
         created_title.move_to(DOWN * 0.2)
 
         author_info = VGroup(
-            Text("Fernando Ruscitti", font_size=22, color=WHITE),
-            Text("fernando.ruscitti@redbee.com", font_size=18, color=BLUE, font="monospace")
+            cached_text("Fernando Ruscitti", font_size=22, color=WHITE),
+            cached_text("fernando.ruscitti@redbee.com", font_size=18, color=BLUE, font="monospace")
         ).arrange(DOWN, buff=0.15)
         author_info.next_to(created_title, DOWN, buff=0.25)
 
@@ -2392,10 +2613,10 @@ class JPOSScenes:
         except Exception as e:
             # If logos fail to load, show text labels instead
             print(f"Logo loading error: {e}")
-            jpos_label = Text("jPOS.org", font_size=22, color="#BE0811")
+            jpos_label = cached_text("jPOS.org", font_size=22, color="#BE0811")
             jpos_label.move_to(LEFT * 2.5 + DOWN * 2.8)
 
-            redbee_label = Text("RedBee Studios", font_size=22, color="#FF0001")
+            redbee_label = cached_text("RedBee Studios", font_size=22, color="#FF0001")
             redbee_label.move_to(RIGHT * 2.5 + DOWN * 2.8)
 
             scene.play(
@@ -2407,322 +2628,443 @@ class JPOSScenes:
         scene.wait(0.5)
 
         # Footer link
-        footer = Text("https://redbee.io", font_size=22, color=BLUE)
+        footer = cached_text("https://redbee.io", font_size=22, color=BLUE)
         footer.to_edge(DOWN, buff=0.3)
         scene.play(FadeIn(footer, shift=UP), run_time=0.6)
 
         scene.wait(3)
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
 
     @staticmethod
     def construct_putting_together(scene):
         """Putting it together (10-15s)."""
         add_watermark(scene)
 
+        def create_flow(*stages):
+            """Row of (name, color) stages joined by arrows, shaped as one Text."""
+            parts = [part for name, _ in stages for part in (name, "→")][:-1]
+            blocks = split_glyphs(cached_text("  ".join(parts), font_size=22), parts)
+            for block, (_, color) in zip(blocks[::2], stages):
+                block.set_color(color)
+            # The arrows read better slightly larger than the labels
+            for arrow in blocks[1::2]:
+                arrow.scale(24 / 22)
+            return VGroup(*blocks).arrange(RIGHT, buff=0.2)
+
         # Title
-        title = Text("jPOS Stack in Action", font_size=40, weight=BOLD)
+        title = cached_text("jPOS Stack in Action", font_size=40, weight=BOLD)
         title.to_edge(UP)
         scene.play(Write(title), run_time=0.8)
 
         # Flow 1 - Sending
-        flow1_label = Text("Sending:", font_size=28, weight=BOLD)
+        flow1_label = cached_text("Sending:", font_size=28, weight=BOLD)
         flow1_label.move_to(UP * 1.8 + LEFT * 2)
 
-        flow1_blocks = VGroup(
-            Text("ISOMsg", font_size=22, color=COLOR_ISOMSG),
-            Text("→", font_size=24),
-            Text("Packager", font_size=22, color=COLOR_PACKAGER),
-            Text("→", font_size=24),
-            Text("Bytes", font_size=22, color=GREEN),
-            Text("→", font_size=24),
-            Text("Channel", font_size=22, color=COLOR_CHANNEL),
-            Text("→", font_size=24),
-            Text("Socket", font_size=22, color=BLUE),
-        ).arrange(RIGHT, buff=0.2)
+        flow1_blocks = create_flow(
+            ("ISOMsg", COLOR_ISOMSG),
+            ("Packager", COLOR_PACKAGER),
+            ("Bytes", GREEN),
+            ("Channel", COLOR_CHANNEL),
+            ("Socket", BLUE),
+        )
         flow1_blocks.next_to(flow1_label, DOWN, buff=0.4)
 
         scene.play(Write(flow1_label))
-        scene.play(LaggedStart(*[FadeIn(block, shift=RIGHT) for block in flow1_blocks], lag_ratio=0.1))
+        scene.play(lagged_fade_in(flow1_blocks, shift=RIGHT, lag_ratio=0.1))
         scene.wait(1)
 
         # Flow 2 - QMUX Request/Response
-        flow2_label = Text("QMUX Request/Response:", font_size=28, weight=BOLD)
+        flow2_label = cached_text("QMUX Request/Response:", font_size=28, weight=BOLD)
         flow2_label.move_to(DOWN * 0.5 + LEFT * 2)
 
-        flow2_blocks = VGroup(
-            Text("ISOMsg", font_size=22, color=COLOR_ISOMSG),
-            Text("→", font_size=24),
-            Text("QMUX", font_size=22, color=COLOR_QMUX),
-            Text("→", font_size=24),
-            Text("Queue", font_size=22, color=COLOR_QMUX),
-            Text("→", font_size=24),
-            Text("Channel", font_size=22, color=COLOR_CHANNEL),
-            Text("→", font_size=24),
-            Text("Response", font_size=22, color=BLUE),
-            Text("→", font_size=24),
-            Text("Key Match", font_size=22, color=YELLOW),
-            Text("→", font_size=24),
-            Text("Deliver", font_size=22, color=GREEN),
-        ).arrange(RIGHT, buff=0.2)
+        flow2_blocks = create_flow(
+            ("ISOMsg", COLOR_ISOMSG),
+            ("QMUX", COLOR_QMUX),
+            ("Queue", COLOR_QMUX),
+            ("Channel", COLOR_CHANNEL),
+            ("Response", BLUE),
+            ("Key Match", YELLOW),
+            ("Deliver", GREEN),
+        )
         flow2_blocks.scale(0.85)
         flow2_blocks.next_to(flow2_label, DOWN, buff=0.4)
 
         scene.play(Write(flow2_label))
-        scene.play(LaggedStart(*[FadeIn(block, shift=RIGHT) for block in flow2_blocks], lag_ratio=0.08))
+        scene.play(lagged_fade_in(flow2_blocks, shift=RIGHT, lag_ratio=0.08))
         scene.wait(1.5)
 
         # Final overlay
-        final_text = Text("Production-grade ISO 8583 toolkit", font_size=32, color=COLOR_JPOS_BRAND, weight=BOLD)
+        final_text = cached_text("Production-grade ISO 8583 toolkit", font_size=32, color=COLOR_JPOS_BRAND, weight=BOLD)
         final_text.to_edge(DOWN, buff=1)
         scene.play(FadeIn(final_text, shift=UP))
         scene.wait(2)
-        scene.play(*[FadeOut(mob) for mob in scene.mobjects])
+        fade_out_all(scene)
+
+
+# =============================================================================
+# FRAME ENCODING
+# =============================================================================
+
+# Upper bound on raw frames waiting for the encoder (1080p RGBA is ~8 MB/frame)
+FRAME_QUEUE_BYTES = 256 * 1024 * 1024
+
+
+class BackgroundFileWriter(SceneFileWriter):
+    """SceneFileWriter that hands frames to a writer thread through a bounded queue.
+
+    Cairo keeps rendering while the encoder catches up on a slow frame; the queue
+    is drained before every partial movie is closed, so Manim's file handling
+    and caching are unchanged. A failed write is raised on the render thread at
+    the next frame, at the end of the animation or in finish(), whichever comes
+    first; frames after it are dropped.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        frame_bytes = config.pixel_width * config.pixel_height * 4
+        self._frames = queue.Queue(maxsize=max(1, FRAME_QUEUE_BYTES // frame_bytes))
+        self._write_error = None
+        self._writer = threading.Thread(target=self._drain_frames, daemon=True)
+        self._writer.start()
+
+    def _drain_frames(self):
+        while True:
+            item = self._frames.get()
+            try:
+                # None is the stop sentinel sent by finish()
+                if item is None:
+                    return
+                if self._write_error is None:
+                    args, kwargs = item
+                    super().write_frame(*args, **kwargs)
+            except Exception as error:
+                self._write_error = error
+            finally:
+                self._frames.task_done()
+
+    def _raise_write_error(self):
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def _wait_for_frames(self):
+        self._frames.join()
+        self._raise_write_error()
+
+    def write_frame(self, *args, **kwargs):
+        # OpenGL hands over the renderer itself and reads the framebuffer on write
+        if config.renderer != RendererType.CAIRO:
+            return super().write_frame(*args, **kwargs)
+        self._raise_write_error()
+        # Queued by reference: CairoRenderer.get_frame() returns a fresh copy of
+        # the camera's pixel array for every add_frame, and nothing mutates it
+        self._frames.put((args, kwargs))
+
+    def end_animation(self, *args, **kwargs):
+        self._wait_for_frames()
+        super().end_animation(*args, **kwargs)
+
+    def finish(self, *args, **kwargs):
+        try:
+            self._wait_for_frames()
+        finally:
+            self._frames.put(None)
+            self._writer.join()
+        super().finish(*args, **kwargs)
+
+
+class BackgroundEncoding:
+    """Scene mixin that renders through BackgroundFileWriter under the Cairo renderer."""
+
+    def __init__(self, *args, **kwargs):
+        # Let the Scene build its own renderer so camera_class and the other
+        # renderer settings of any subclass (MovingCameraScene, ...) still apply;
+        # only the file writer is swapped, before anything has been written
+        super().__init__(*args, **kwargs)
+        if isinstance(self.renderer, CairoRenderer) and not isinstance(self.renderer.file_writer, BackgroundFileWriter):
+            self.renderer.file_writer = BackgroundFileWriter(self.renderer, self.__class__.__name__)
 
 
 # =============================================================================
 # INDIVIDUAL SCENE CLASSES
 # =============================================================================
 
-class ColdOpen(Scene):
-    """Cold open with title card (2-3s)."""
+class SlideSequence(BackgroundEncoding):
+    """Scene mixin that plays a fixed sequence of ISO8583Scenes/JPOSScenes constructors.
+
+    Kept out of the Scene hierarchy so Manim does not list it as a renderable scene.
+    """
+
+    slides = ()
+
     def construct(self):
-        ISO8583Scenes.construct_cold_open(self)
+        for build in self.slides:
+            build(self)
 
 
-class WhatIsISO8583(Scene):
+class ColdOpen(SlideSequence, Scene):
+    """Cold open with title card (2-3s)."""
+    slides = (ISO8583Scenes.construct_cold_open,)
+
+
+class WhatIsISO8583(SlideSequence, Scene):
     """Introduction to ISO 8583 (10-15s)."""
-    def construct(self):
-        ISO8583Scenes.construct_what_is_iso8583(self)
+    slides = (ISO8583Scenes.construct_what_is_iso8583,)
 
 
-class MeetTheMessage(Scene):
+class MeetTheMessage(SlideSequence, Scene):
     """Display the full message structure (15-20s)."""
-    def construct(self):
-        ISO8583Scenes.construct_meet_the_message(self)
+    slides = (ISO8583Scenes.construct_meet_the_message,)
 
 
-class MTIDeepDive(Scene):
+class MTIDeepDive(SlideSequence, Scene):
     """MTI breakdown (20-30s)."""
-    def construct(self):
-        ISO8583Scenes.construct_mti_deep_dive(self)
+    slides = (ISO8583Scenes.construct_mti_deep_dive,)
 
 
-class BitmapConcept(Scene):
+class BitmapConcept(SlideSequence, Scene):
     """Bitmap explanation with bit numbering (25-35s)."""
-    def construct(self):
-        ISO8583Scenes.construct_bitmap_concept(self)
+    slides = (ISO8583Scenes.construct_bitmap_concept,)
 
 
-class SecondaryBitmap(Scene):
+class SecondaryBitmap(SlideSequence, Scene):
     """Secondary bitmap explanation (8-12s)."""
-    def construct(self):
-        ISO8583Scenes.construct_secondary_bitmap(self)
+    slides = (ISO8583Scenes.construct_secondary_bitmap,)
 
 
-class DataElementsFixedVsVariable(Scene):
+class DataElementsFixedVsVariable(SlideSequence, Scene):
     """Compare fixed and variable length fields (35-45s)."""
-    def construct(self):
-        ISO8583Scenes.construct_data_elements_fixed_vs_variable(self)
+    slides = (ISO8583Scenes.construct_data_elements_fixed_vs_variable,)
 
 
-class AnotherFixedExample(Scene):
+class AnotherFixedExample(SlideSequence, Scene):
     """Show DE 11 STAN (10-12s)."""
-    def construct(self):
-        ISO8583Scenes.construct_another_fixed_example(self)
+    slides = (ISO8583Scenes.construct_another_fixed_example,)
 
 
-class DataTypesCheatSheet(Scene):
+class DataTypesCheatSheet(SlideSequence, Scene):
     """Data types reference (10-15s)."""
-    def construct(self):
-        ISO8583Scenes.construct_data_types_cheat_sheet(self)
+    slides = (ISO8583Scenes.construct_data_types_cheat_sheet,)
 
 
-class OnTheWire(Scene):
+class OnTheWire(SlideSequence, Scene):
     """Network transmission visualization (20-30s)."""
-    def construct(self):
-        ISO8583Scenes.construct_on_the_wire(self)
+    slides = (ISO8583Scenes.construct_on_the_wire,)
 
 
-class RecapAndPointers(Scene):
+class RecapAndPointers(SlideSequence, Scene):
     """Final summary (10-15s)."""
-    def construct(self):
-        ISO8583Scenes.construct_recap_and_pointers(self)
+    slides = (ISO8583Scenes.construct_recap_and_pointers,)
 
 
 # =============================================================================
 # jPOS SCENE CLASSES
 # =============================================================================
 
-class JPOSIntro(Scene):
+class JPOSIntro(SlideSequence, Scene):
     """Intro to jPOS (8-12s)."""
-    def construct(self):
-        JPOSScenes.construct_jpos_intro(self)
+    slides = (JPOSScenes.construct_jpos_intro,)
 
 
-class ISOMsgComposite(Scene):
+class ISOMsgComposite(SlideSequence, Scene):
     """ISOMsg uses Composite pattern (20-25s)."""
-    def construct(self):
-        JPOSScenes.construct_isomsg_composite(self)
+    slides = (JPOSScenes.construct_isomsg_composite,)
 
 
-class PackagerConcept(Scene):
-    """What is a Packager? (25-30s)."""
-    def construct(self):
-        JPOSScenes.construct_packager_concept(self)
+class PackagerDefinition(SlideSequence, Scene):
+    """Defining a Packager (15-20s)."""
+    slides = (JPOSScenes.construct_packager_definition,)
 
 
-class PackagerDefinition(Scene):
-    """Defining a Packager (15-20s)."""
-    def construct(self):
-        JPOSScenes.construct_packager_definition(self)
+class PackagerConcept(SlideSequence, Scene):
+    """What is a Packager? (25-30s)."""
+    slides = (JPOSScenes.construct_packager_concept,)
 
 
-class CompositeSubfields(Scene):
+class CompositeSubfields(SlideSequence, Scene):
     """Composite subfields - DE 3 (25-35s)."""
-    def construct(self):
-        JPOSScenes.construct_composite_subfields(self)
+    slides = (JPOSScenes.construct_composite_subfields,)
 
 
-class BytePacking(Scene):
+class BytePacking(SlideSequence, Scene):
     """Byte-by-byte packing vignette (30-40s)."""
-    def construct(self):
-        JPOSScenes.construct_byte_packing(self)
+    slides = (JPOSScenes.construct_byte_packing,)
 
 
-class Channels(Scene):
+class Channels(SlideSequence, Scene):
     """Channels (20-25s)."""
-    def construct(self):
-        JPOSScenes.construct_channels(self)
+    slides = (JPOSScenes.construct_channels,)
 
 
-class QMUX(Scene):
+class QMUX(SlideSequence, Scene):
     """QMUX - Multiplexing (35-45s)."""
-    def construct(self):
-        JPOSScenes.construct_qmux(self)
+    slides = (JPOSScenes.construct_qmux,)
 
 
-class PuttingTogether(Scene):
+class PuttingTogether(SlideSequence, Scene):
     """Putting it together (10-15s)."""
-    def construct(self):
-        JPOSScenes.construct_putting_together(self)
+    slides = (JPOSScenes.construct_putting_together,)
+
+
+class JPOSCredits(SlideSequence, Scene):
+    """Standalone credits scene for jPOS presentation."""
+    slides = (JPOSScenes.construct_jpos_credits,)
 
 
 # =============================================================================
 # FULL PRESENTATION (All scenes chained)
 # =============================================================================
 
-class FullPresentation(Scene):
-    """Complete presentation with all scenes chained together."""
-
-    def construct(self):
-        # Scene 0: Cold Open
-        ISO8583Scenes.construct_cold_open(self)
-
-        # Scene 1: What is ISO 8583?
-        ISO8583Scenes.construct_what_is_iso8583(self)
-
-        # Scene 2: Meet the Message
-        ISO8583Scenes.construct_meet_the_message(self)
-
-        # Scene 3: MTI Deep Dive
-        ISO8583Scenes.construct_mti_deep_dive(self)
-
-        # Scene 4: Bitmap Concept
-        ISO8583Scenes.construct_bitmap_concept(self)
-
-        # Scene 5: Secondary Bitmap
-        ISO8583Scenes.construct_secondary_bitmap(self)
-
-        # Scene 6: Data Elements Fixed vs Variable
-        ISO8583Scenes.construct_data_elements_fixed_vs_variable(self)
-
-        # Scene 7: Another Fixed Example (DE 11)
-        ISO8583Scenes.construct_another_fixed_example(self)
-
-        # Scene 8: Data Types Cheat Sheet
-        ISO8583Scenes.construct_data_types_cheat_sheet(self)
-
-        # Scene 9: On the Wire
-        ISO8583Scenes.construct_on_the_wire(self)
-
-        # Scene 10: Recap and Pointers
-        ISO8583Scenes.construct_recap_and_pointers(self)
+class PartSequence:
+    """Scene mixin that chains SlideSequence scenes in a single movie.
 
+    Each part starts a section named after its scene class; render with
+    --save_sections to also get one video per part next to the full movie.
+    Whatever a part fades out is collected before the next part starts instead
+    of piling up over the whole movie; anything it leaves on screen (usually
+    its watermark) stays, as before.
+    """
 
-class FullPresentationWithJPOS(Scene):
-    """Complete presentation with ISO 8583 and jPOS scenes chained together."""
+    parts = ()
 
     def construct(self):
-        # ===== ISO 8583 Scenes =====
-        # Scene 0: Cold Open
-        ISO8583Scenes.construct_cold_open(self)
-
-        # Scene 1: What is ISO 8583?
-        ISO8583Scenes.construct_what_is_iso8583(self)
+        for part in self.parts:
+            self.next_section(part.__name__)
+            for build in part.slides:
+                build(self)
+            gc.collect()
 
-        # Scene 2: Meet the Message
-        ISO8583Scenes.construct_meet_the_message(self)
 
-        # Scene 3: MTI Deep Dive
-        ISO8583Scenes.construct_mti_deep_dive(self)
+class FullPresentation(PartSequence, BackgroundEncoding, Scene):
+    """Complete presentation with all scenes chained together.
 
-        # Scene 4: Bitmap Concept
-        ISO8583Scenes.construct_bitmap_concept(self)
-
-        # Scene 5: Secondary Bitmap
-        ISO8583Scenes.construct_secondary_bitmap(self)
-
-        # Scene 6: Data Elements Fixed vs Variable
-        ISO8583Scenes.construct_data_elements_fixed_vs_variable(self)
-
-        # Scene 7: Another Fixed Example (DE 11)
-        ISO8583Scenes.construct_another_fixed_example(self)
+    Frames are encoded on a background thread, like the individual scenes.
+    """
+    parts = (
+        ColdOpen,
+        WhatIsISO8583,
+        MeetTheMessage,
+        MTIDeepDive,
+        BitmapConcept,
+        SecondaryBitmap,
+        DataElementsFixedVsVariable,
+        AnotherFixedExample,
+        DataTypesCheatSheet,
+        OnTheWire,
+        RecapAndPointers,
+    )
+
+
+class FullPresentationWithJPOS(PartSequence, BackgroundEncoding, Scene):
+    """Complete presentation with ISO 8583 and jPOS scenes chained together.
+
+    Frames are encoded on a background thread, like the individual scenes; an
+    encoder failure still aborts the render (see BackgroundFileWriter).
+    """
+    parts = FullPresentation.parts + (
+        JPOSIntro,
+        ISOMsgComposite,
+        PackagerDefinition,  # show XML config first
+        PackagerConcept,     # then show it in action
+        CompositeSubfields,
+        BytePacking,
+        Channels,
+        QMUX,
+        PuttingTogether,
+        JPOSCredits,
+    )
 
-        # Scene 8: Data Types Cheat Sheet
-        ISO8583Scenes.construct_data_types_cheat_sheet(self)
 
-        # Scene 9: On the Wire
-        ISO8583Scenes.construct_on_the_wire(self)
+# =============================================================================
+# PARALLEL RENDERING (python main.py)
+# =============================================================================
 
-        # Scene 10: Recap and Pointers
-        ISO8583Scenes.construct_recap_and_pointers(self)
+# Scenes that chain the individual scenes; rendering them next to their parts
+# would repeat the same work, so they are only rendered when named explicitly.
+CHAINED_SCENES = {"FullPresentation", "FullPresentationWithJPOS"}
 
-        # ===== jPOS Scenes =====
-        # Scene J0: jPOS Intro
-        JPOSScenes.construct_jpos_intro(self)
 
-        # Scene J1: ISOMsg Composite Pattern
-        JPOSScenes.construct_isomsg_composite(self)
+def discover_scenes():
+    """Return the names of the individual scenes in this file, in definition order."""
+    module = sys.modules[__name__]
+    return [
+        name for name, obj in vars(module).items()
+        if isinstance(obj, type) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+        and name not in CHAINED_SCENES
+    ]
 
-        # Scene J2: Packager Definition (show XML config first)
-        JPOSScenes.construct_packager_definition(self)
 
-        # Scene J3: Packager Concept (then show it in action)
-        JPOSScenes.construct_packager_concept(self)
+def render_scene(scene_name, quality="m"):
+    """Render one scene in its own manim process and return its exit code."""
+    command = [sys.executable, "-m", "manim", f"-q{quality}", __file__, scene_name]
+    return subprocess.run(command).returncode
 
-        # Scene J4: Composite Subfields
-        JPOSScenes.construct_composite_subfields(self)
 
-        # Scene J5: Byte Packing
-        JPOSScenes.construct_byte_packing(self)
+def render_scenes(scene_names, quality="m", max_workers=None):
+    """Render independent scenes concurrently, one manim process per scene."""
+    # Write the watermark SVG every scene reads once, before the workers start
+    _warm_text_cache()
+    # Each render is its own process already; threads only wait on them
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        codes = list(pool.map(lambda name: render_scene(name, quality), scene_names))
+    return [name for name, code in zip(scene_names, codes) if code != 0]
 
-        # Scene J6: Channels
-        JPOSScenes.construct_channels(self)
 
-        # Scene J7: QMUX
-        JPOSScenes.construct_qmux(self)
+def quality_folder(quality):
+    """Return the videos subfolder (e.g. "720p30") manim writes to for a -q flag."""
+    # MANIM_FAST and MANIM_PREVIEW override the flag in the workers too, and
+    # this process applied the same override to config when it imported main.py
+    if FAST_RENDER or os.environ.get("MANIM_PREVIEW"):
+        return f"{config.pixel_height}p{config.frame_rate}"
+    settings = next(settings for settings in QUALITIES.values() if settings["flag"] == quality)
+    return f"{settings['pixel_height']}p{settings['frame_rate']}"
 
-        # Scene J8: Putting Together
-        JPOSScenes.construct_putting_together(self)
 
-        # Scene J9: Credits
-        JPOSScenes.construct_jpos_credits(self)
+def find_rendered_video(scene_name, quality="m"):
+    """Return the movie rendered for scene_name at the given -q flag."""
+    path = Path(config.media_dir) / "videos" / Path(__file__).stem / quality_folder(quality) / f"{scene_name}.mp4"
+    if not path.exists():
+        raise FileNotFoundError(f"{scene_name} has no render at {path}")
+    return path
 
 
-# Standalone Credits Scene
-class JPOSCredits(Scene):
-    """Standalone credits scene for jPOS presentation."""
-    
-    def construct(self):
-        JPOSScenes.construct_jpos_credits(self)
+def concat_videos(video_paths, output_path):
+    """Join rendered scenes back to back with ffmpeg's concat demuxer (no re-encode).
 
+    Every scene comes from the same quality flag, so the streams share size,
+    frame rate and pixel format and can be copied as is. The index is moved to
+    the front of the file so players can start before it is fully downloaded.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        listing.writelines(f"file '{path.resolve()}'\n" for path in video_paths)
+    command = [
+        "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", listing.name,
+        "-c", "copy", "-movflags", "+faststart", str(output_path),
+    ]
+    try:
+        return subprocess.run(command).returncode
+    finally:
+        os.remove(listing.name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render scenes in parallel.")
+    parser.add_argument("scenes", nargs="*", help="scene names (default: all individual scenes)")
+    parser.add_argument("-q", "--quality", default="m", choices=list("lmhpk"), help="manim quality flag")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="parallel renders (default: CPU count)")
+    parser.add_argument("--concat", metavar="OUTPUT", help="join the rendered scenes, in order, into OUTPUT")
+    args = parser.parse_args()
+
+    scene_names = args.scenes or discover_scenes()
+    started = time.time()
+    failed = render_scenes(scene_names, args.quality, args.jobs)
+    if failed:
+        sys.exit(f"Failed to render: {', '.join(failed)}")
+    if args.concat:
+        videos = [find_rendered_video(name, args.quality) for name in scene_names]
+        # Never splice in a movie left over from an earlier render
+        stale = [video.stem for video in videos if video.stat().st_mtime < started]
+        if stale:
+            sys.exit(f"Not rendered by this run: {', '.join(stale)}")
+        if concat_videos(videos, args.concat):
+            sys.exit(f"Failed to write {args.concat}")